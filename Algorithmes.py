@@ -0,0 +1,111 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Registres des générateurs et des algorithmes de recherche, partagés par
+l'interface et les outils en ligne de commande. Ne dépend pas de Pygame.
+"""
+import random
+import time
+from importlib.util import find_spec
+
+from Moteur import SearchStats, create_grid, generate_lab, generate_kruskal, generate_wilson, generate_prim
+from Moteur import dijkstra, a_star, bfs, dfs, bidirectional_bfs, bidirectional_a_star
+from Moteur import dijkstra_steps, a_star_steps, bfs_steps, dfs_steps, bidirectional_bfs_steps, bidirectional_a_star_steps
+from Flux import generate_eller
+from Pretraitement import get_contraction, get_oracle, contracted_dijkstra, contracted_a_star, oracle_search
+
+#--------------------------------------- BFS vectoriel (import différé) -----------------------------------
+def load_wavefront():
+    """
+    Importe Vectoriel (et donc NumPy) et renvoie son BFS vectoriel.
+    """
+    from Vectoriel import wavefront_bfs as search
+    return search
+
+def wavefront_bfs(grid, start, end, state):
+    """
+    BFS vectoriel de Vectoriel.py, importé au premier appel : les outils qui
+    n'utilisent pas ce mode ne paient pas l'import de NumPy.
+    """
+    return load_wavefront()(grid, start, end, state)
+
+# Chargement à faire hors chronomètre (voir timed_search)
+wavefront_bfs.warm_up = load_wavefront
+
+#--------------------------------------- Registres -----------------------------------
+# Générateurs proposés : clé -> (nom affiché, fonction de génération)
+GENERATORS = {
+    'backtracker': ('Backtrack', generate_lab),
+    'kruskal': ('Kruskal', generate_kruskal),
+    'wilson': ('Wilson', generate_wilson),
+    'prim': ('Prim', generate_prim),
+    'eller': ('Eller', generate_eller),
+}
+
+# Algorithmes proposés : clé -> (nom affiché, fonction de recherche)
+ALGORITHMS = {
+    'dijkstra': ('Dijkstra', dijkstra),
+    'astar': ('A*', a_star),
+    'bfs': ('BFS', bfs),
+    'dfs': ('DFS', dfs),
+    'bibfs': ('BFS bidir.', bidirectional_bfs),
+    'biastar': ('A* bidir.', bidirectional_a_star),
+    'cdijkstra': ('Dijkstra contr.', contracted_dijkstra),
+    'castar': ('A* contr.', contracted_a_star),
+    'oracle': ('Oracle', oracle_search),
+}
+if find_spec('numpy') is not None:  # NumPy absent : le BFS vectoriel n'est pas proposé
+    ALGORITHMS['wavefront'] = ('BFS vectoriel', wavefront_bfs)
+
+# Versions pas à pas (générateurs des cellules développées) des algorithmes qui explorent cellule par cellule
+STEPPERS = {
+    'dijkstra': dijkstra_steps,
+    'astar': a_star_steps,
+    'bfs': bfs_steps,
+    'dfs': dfs_steps,
+    'bibfs': bidirectional_bfs_steps,
+    'biastar': bidirectional_a_star_steps,
+}
+
+def prepare_maze(grid):
+    """
+    Construit et met en cache les index d'un labyrinthe figé (contraction,
+    oracle), pour que leur coût n'entre pas dans le temps des recherches.
+    """
+    get_contraction(grid)
+    get_oracle(grid)
+
+def generate_maze(rows, cols, generator='backtracker', seed=None):
+    """
+    Crée et génère un labyrinthe figé avec le générateur choisi dans GENERATORS.
+    Une graine rend la génération reproductible.
+    """
+    if seed is not None:
+        random.seed(seed)
+    grid = create_grid(rows, cols)
+    GENERATORS[generator][1](grid)
+    return grid
+
+def timed_search(algo_func, grid, start, end, state, collect_stats=True):
+    """
+    Chronomètre une recherche sans compteurs, puis, avec collect_stats, la
+    relance hors chronomètre avec les compteurs détaillés (comme Benchmark.py).
+    Renvoie (durée, trouvé, compteurs), compteurs valant None sans
+    collect_stats ; l'état contient ensuite le chemin trouvé.
+    """
+    warm_up = getattr(algo_func, 'warm_up', None)
+    if warm_up is not None:
+        warm_up()  # Import différé de l'algorithme, hors du temps mesuré
+    state.stats = None
+    state.reset()
+    start_time = time.perf_counter()
+    found = algo_func(grid, start, end, state)
+    elapsed_time = time.perf_counter() - start_time
+    if not collect_stats:
+        return elapsed_time, found, None
+
+    stats = SearchStats()
+    state.stats = stats
+    state.reset()
+    algo_func(grid, start, end, state)
+    state.stats = None
+    return elapsed_time, found, stats
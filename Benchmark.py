@@ -0,0 +1,355 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Banc d'essai des algorithmes de recherche, sans interface graphique.
+
+Chaque algorithme est d'abord exécuté quelques fois à vide (échauffement),
+puis mesuré sur plusieurs essais avec perf_counter_ns, le ramasse-miettes
+étant suspendu pendant les sections chronométrées. Les labyrinthes, départs
+et arrivées sont tirés à partir d'une graine : deux lancements avec la même
+graine mesurent exactement les mêmes recherches.
+
+Avec --sizes, le banc parcourt plusieurs tailles de labyrinthe, relève aussi
+la mémoire de pointe de chaque recherche et estime l'exposant de croissance
+empirique de chaque algorithme (temps ~ cellules ** exposant).
+
+Avec --generators, ce sont les générateurs de labyrinthe qui sont mesurés,
+à la taille donnée ou à chaque taille de --sizes.
+
+Exemples :
+    python Benchmark.py --size 40 --mazes 5 --repeat 50 --seed 1 --json resultats.json
+    python Benchmark.py --sizes 20 40 80 160 320 640 1280 2560 --repeat 3 --csv croissance.csv
+    python Benchmark.py --generators --sizes 100 300 1000 --repeat 3
+"""
+import argparse
+import csv
+import gc
+import json
+import platform
+import random
+import sys
+import tracemalloc
+from math import log
+from time import perf_counter_ns
+
+from Moteur import SearchState, SearchStats, create_grid, reconstruct_p
+from Algorithmes import ALGORITHMS, GENERATORS, generate_maze, prepare_maze
+
+# Colonnes des résultats, dans l'ordre des fichiers CSV
+FIELDS = ['algorithm', 'generator', 'maze', 'seed', 'rows', 'cols', 'warmup', 'repeat',
+          'found', 'path_length', 'expanded', 'scanned', 'pushes', 'pops', 'stale', 'max_frontier', 'min_ns', 'median_ns', 'p95_ns', 'peak_bytes']
+
+# Colonnes des mesures de générateurs
+GENERATOR_FIELDS = ['generator', 'seed', 'rows', 'cols', 'warmup', 'repeat',
+                    'min_ns', 'median_ns', 'p95_ns', 'ns_per_cell']
+
+# Tailles parcourues par défaut par le banc de croissance
+DEFAULT_SIZES = [20, 40, 80, 160, 320, 640, 1280, 2560]
+
+#--------------------------------------- Mesures -----------------------------------
+def seeded_maze(rows, cols, seed, generator='backtracker'):
+    """
+    Génère un labyrinthe et choisit départ et arrivée comme main() :
+    une ligne au hasard dans la première et dans la dernière colonne.
+    """
+    grid = generate_maze(rows, cols, generator, seed)
+    prepare_maze(grid)
+    start, end = grid[random.randint(0, rows - 1)][0], grid[random.randint(0, rows - 1)][cols - 1]
+    return grid, start, end
+
+def time_solver(algo_func, grid, start, end, state, repeat, warmup):
+    """
+    Exécute warmup recherches à vide puis repeat recherches chronométrées.
+    Renvoie la liste des durées en nanosecondes.
+    """
+    for _ in range(warmup):
+        state.reset()
+        algo_func(grid, start, end, state)
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            state.reset()
+            begin = perf_counter_ns()
+            algo_func(grid, start, end, state)
+            samples.append(perf_counter_ns() - begin)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+def peak_memory(algo_func, grid, start, end, state):
+    """
+    Mémoire de pointe (en octets) allouée pendant une recherche, mesurée avec
+    tracemalloc lors d'une exécution séparée des exécutions chronométrées.
+    """
+    state.reset()
+    tracemalloc.start()
+    try:
+        algo_func(grid, start, end, state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def percentile(sorted_samples, fraction):
+    """
+    Percentile par rang le plus proche d'une liste déjà triée.
+    """
+    rank = max(0, min(len(sorted_samples) - 1, round(fraction * len(sorted_samples) + 0.5) - 1))
+    return sorted_samples[rank]
+
+def summarize(samples):
+    """
+    Résume une série de durées : minimum, médiane et 95e percentile.
+    """
+    ordered = sorted(samples)
+    middle = len(ordered) // 2
+    median = ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) // 2
+    return {'min_ns': ordered[0], 'median_ns': median, 'p95_ns': percentile(ordered, 0.95)}
+
+def run_benchmark(rows, cols, seed, algorithms, mazes=1, repeat=30, warmup=3, measure_memory=False,
+                  generator='backtracker'):
+    """
+    Mesure chaque algorithme sur mazes labyrinthes de graines seed, seed + 1, ...
+    Renvoie une liste d'enregistrements (dictionnaires aux clés FIELDS).
+    """
+    records = []
+    for maze in range(mazes):
+        grid, start, end = seeded_maze(rows, cols, seed + maze, generator)
+        state = SearchState(grid)
+        for key in algorithms:
+            _, algo_func = ALGORITHMS[key]
+            samples = time_solver(algo_func, grid, start, end, state, repeat, warmup)
+
+            # Une dernière exécution, hors chronométrage, pour le résultat et les compteurs
+            state.stats = SearchStats()
+            state.reset()
+            found = algo_func(grid, start, end, state)
+            stats, state.stats = state.stats, None
+            record = {
+                'algorithm': key, 'generator': generator, 'maze': maze, 'seed': seed + maze, 'rows': rows, 'cols': cols,
+                'warmup': warmup, 'repeat': repeat, 'found': found,
+                'path_length': len(reconstruct_p(end, state)) if found else None,
+                **stats.as_dict(),
+                'peak_bytes': peak_memory(algo_func, grid, start, end, state) if measure_memory else None,
+            }
+            record.update(summarize(samples))
+            records.append(record)
+    return records
+
+def run_scaling(sizes, seed, algorithms, mazes=1, repeat=3, warmup=1, generator='backtracker'):
+    """
+    Banc de croissance : mesure chaque algorithme sur des labyrinthes carrés
+    de chaque taille, mémoire de pointe comprise.
+    """
+    records = []
+    for size in sizes:
+        records.extend(run_benchmark(size, size, seed, algorithms, mazes, repeat, warmup,
+                                     measure_memory=True, generator=generator))
+    return records
+
+def time_generator(generate, rows, cols, seed, repeat, warmup):
+    """
+    Chronomètre repeat générations (gel du labyrinthe compris) d'une grille
+    rows x cols, toutes avec la même graine. Renvoie les durées en nanosecondes.
+    """
+    for _ in range(warmup):
+        random.seed(seed)
+        generate(create_grid(rows, cols))
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            grid = create_grid(rows, cols)
+            random.seed(seed)
+            begin = perf_counter_ns()
+            generate(grid)
+            samples.append(perf_counter_ns() - begin)
+            del grid
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+def run_generators(sizes, seed, generators, repeat=5, warmup=1):
+    """
+    Mesure chaque générateur sur des grilles de chaque taille (lignes, colonnes).
+    Renvoie une liste d'enregistrements (dictionnaires aux clés GENERATOR_FIELDS).
+    """
+    records = []
+    for rows, cols in sizes:
+        for key in generators:
+            _, generate = GENERATORS[key]
+            record = {'generator': key, 'seed': seed, 'rows': rows, 'cols': cols,
+                      'warmup': warmup, 'repeat': repeat}
+            record.update(summarize(time_generator(generate, rows, cols, seed, repeat, warmup)))
+            record['ns_per_cell'] = record['median_ns'] / (rows * cols)
+            records.append(record)
+    return records
+
+def scaling_exponent(points):
+    """
+    Pente de la droite des moindres carrés en échelle log-log : pour des
+    points (cellules, valeur), l'exposant k tel que valeur ~ cellules ** k.
+    """
+    points = [(log(cells), log(value)) for cells, value in points if value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+def scaling_exponents(records, metric='median_ns'):
+    """
+    Exposant de croissance de chaque algorithme pour une mesure donnée,
+    moyennée sur les labyrinthes de même taille.
+    """
+    totals = {}
+    for record in records:
+        key = (record['algorithm'], record['rows'] * record['cols'])
+        values = totals.setdefault(key, [])
+        values.append(record[metric])
+    points = {}
+    for (algorithm, cells), values in totals.items():
+        points.setdefault(algorithm, []).append((cells, sum(values) / len(values)))
+    return {algorithm: scaling_exponent(series) for algorithm, series in points.items()}
+
+#--------------------------------------- Export -----------------------------------
+def write_json(records, path, settings, exponents=None):
+    """
+    Écrit les résultats et les paramètres du lancement dans un fichier JSON.
+    """
+    document = {
+        'settings': settings,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': records,
+    }
+    if exponents is not None:
+        document['exponents'] = exponents
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump(document, output, indent=2)
+
+def write_csv(records, path, fields=FIELDS):
+    """
+    Écrit les résultats dans un fichier CSV, une ligne par (labyrinthe, algorithme).
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(records)
+
+def print_table(records):
+    """
+    Affiche un résumé lisible des résultats en microsecondes.
+    """
+    print(f"{'algorithme':<12}{'taille':>11}{'lab.':>5}{'min (us)':>12}{'médiane (us)':>15}{'p95 (us)':>12}"
+          f"{'chemin':>9}{'développés':>12}{'pic (Ko)':>10}")
+    for record in records:
+        peak = '-' if record['peak_bytes'] is None else f"{record['peak_bytes'] / 1024:.0f}"
+        print(f"{record['algorithm']:<12}{str(record['rows']) + 'x' + str(record['cols']):>11}{record['maze']:>5}"
+              f"{record['min_ns'] / 1000:>12.1f}{record['median_ns'] / 1000:>15.1f}{record['p95_ns'] / 1000:>12.1f}"
+              f"{record['path_length'] if record['found'] else '-':>9}{record['expanded']:>12}{peak:>10}")
+
+def print_generator_table(records):
+    """
+    Affiche les durées de génération en millisecondes et le coût par cellule.
+    """
+    print(f"{'générateur':<12}{'taille':>11}{'min (ms)':>12}{'médiane (ms)':>15}{'p95 (ms)':>12}{'ns/cellule':>12}")
+    for record in records:
+        print(f"{record['generator']:<12}{str(record['rows']) + 'x' + str(record['cols']):>11}"
+              f"{record['min_ns'] / 1e6:>12.1f}{record['median_ns'] / 1e6:>15.1f}{record['p95_ns'] / 1e6:>12.1f}"
+              f"{record['ns_per_cell']:>12.0f}")
+
+def print_exponents(time_exponents, expanded_exponents):
+    """
+    Affiche les exposants de croissance empiriques par algorithme.
+    """
+    print()
+    print(f"{'algorithme':<12}{'exposant temps':>16}{'exposant développés':>21}")
+    for algorithm, exponent in time_exponents.items():
+        expanded = expanded_exponents.get(algorithm)
+        print(f"{algorithm:<12}{'-' if exponent is None else f'{exponent:.2f}':>16}"
+              f"{'-' if expanded is None else f'{expanded:.2f}':>21}")
+
+#--------------------------------------- Ligne de commande -----------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai des algorithmes de recherche du labyrinthe.")
+    parser.add_argument('--size', type=int, default=40, help="côté du labyrinthe (lignes = colonnes)")
+    parser.add_argument('--sizes', type=int, nargs='*',
+                        help=f"banc de croissance sur ces côtés (sans valeur : {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--rows', type=int, help="nombre de lignes (remplace --size)")
+    parser.add_argument('--cols', type=int, help="nombre de colonnes (remplace --size)")
+    parser.add_argument('--seed', type=int, default=0, help="graine du premier labyrinthe")
+    parser.add_argument('--mazes', type=int, default=1, help="nombre de labyrinthes mesurés")
+    parser.add_argument('--repeat', type=int, help="essais chronométrés par algorithme (30, 3 avec --sizes, 5 avec --generators)")
+    parser.add_argument('--warmup', type=int, help="exécutions d'échauffement non mesurées (3, ou 1 avec --sizes)")
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=list(ALGORITHMS),
+                        help="algorithmes à mesurer (tous par défaut)")
+    parser.add_argument('--generator', choices=list(GENERATORS), default='backtracker',
+                        help="générateur des labyrinthes mesurés (backtracker par défaut)")
+    parser.add_argument('--generators', nargs='*', choices=list(GENERATORS),
+                        help="mesure ces générateurs au lieu des algorithmes (sans valeur : tous)")
+    parser.add_argument('--json', help="fichier JSON de sortie")
+    parser.add_argument('--csv', help="fichier CSV de sortie")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    settings = {'seed': args.seed, 'mazes': args.mazes, 'algorithms': args.algorithms, 'generator': args.generator}
+    exponents = None
+    fields = FIELDS
+
+    if args.generators is not None:
+        generators = args.generators or list(GENERATORS)
+        if args.sizes is not None:
+            sizes = [(size, size) for size in args.sizes or DEFAULT_SIZES]
+        else:
+            sizes = [(args.rows or args.size, args.cols or args.size)]
+        repeat = args.repeat if args.repeat is not None else 5
+        warmup = args.warmup if args.warmup is not None else 1
+        records = run_generators(sizes, args.seed, generators, repeat, warmup)
+        settings = {'seed': args.seed, 'generators': generators, 'sizes': sizes}
+        fields = GENERATOR_FIELDS
+        if len(sizes) > 1:
+            exponents = {'time': {key: scaling_exponent([(record['rows'] * record['cols'], record['median_ns'])
+                                                         for record in records if record['generator'] == key])
+                                  for key in generators}}
+        print_generator_table(records)
+    elif args.sizes is not None:
+        sizes = args.sizes or DEFAULT_SIZES
+        repeat = args.repeat if args.repeat is not None else 3
+        warmup = args.warmup if args.warmup is not None else 1
+        records = run_scaling(sizes, args.seed, args.algorithms, args.mazes, repeat, warmup, args.generator)
+        settings['sizes'] = sizes
+        exponents = {'time': scaling_exponents(records, 'median_ns'),
+                     'expanded': scaling_exponents(records, 'expanded')}
+        print_table(records)
+        print_exponents(exponents['time'], exponents['expanded'])
+    else:
+        rows = args.rows or args.size
+        cols = args.cols or args.size
+        repeat = args.repeat if args.repeat is not None else 30
+        warmup = args.warmup if args.warmup is not None else 3
+        records = run_benchmark(rows, cols, args.seed, args.algorithms, args.mazes, repeat, warmup,
+                                generator=args.generator)
+        settings.update(rows=rows, cols=cols)
+        print_table(records)
+
+    settings.update(repeat=repeat, warmup=warmup)
+    if args.json:
+        write_json(records, args.json, settings, exponents)
+    if args.csv:
+        write_csv(records, args.csv, fields)
+
+if __name__ == "__main__":
+    main()
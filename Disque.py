@@ -0,0 +1,236 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Recherche hors mémoire : BFS dont les murs, distances et directions
+parentes vivent dans des fichiers projetés (numpy.memmap).
+
+Les cellules sont rangées par blocs carrés de block x block cellules
+(les blocs se suivent ligne par ligne, et les cellules d'un bloc aussi) :
+les voisines d'une cellule sont presque toujours dans le même bloc, donc
+dans les mêmes pages. Le front de chaque niveau est trié par position,
+c'est-à-dire regroupé par bloc, et traité par paquets : les pages sont
+parcourues dans l'ordre du fichier plutôt qu'au hasard, et le cache du
+système peut évincer ce qui a déjà été lu.
+
+Par cellule, il faut 1 octet de murs, 4 octets de distance et 1 octet de
+direction parente sur disque ; seule la mémoire du front est en RAM. Une
+cellule est visitée si sa distance est différente d'INFINITY.
+
+Exemple :
+    python Disque.py labyrinthe.laby --directory /tmp/recherche
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from Moteur import TOP, RIGHT, BOTTOM, LEFT, ALL_WALLS, INFINITY
+
+# Taille par défaut du côté des blocs (64 x 64 cellules : 4 Kio de murs, 16 Kio de distances)
+DEFAULT_BLOCK = 64
+
+# Nombre de cellules du front traitées à la fois
+FRONTIER_CHUNK = 1 << 20
+
+#--------------------------------------- Rangement par blocs -----------------------------------
+class BlockLayout:
+    """
+    Correspondance entre cellules (ligne, colonne) et positions rangées par blocs.
+    """
+    __slots__ = ('rows', 'cols', 'block', 'tile_rows', 'tile_cols', 'size')
+
+    def __init__(self, rows, cols, block=DEFAULT_BLOCK):
+        self.rows = rows
+        self.cols = cols
+        self.block = block
+        self.tile_rows = -(-rows // block)
+        self.tile_cols = -(-cols // block)
+        self.size = self.tile_rows * self.tile_cols * block * block  # bords complétés par des cellules murées
+
+    def positions(self, rows, cols):
+        block = self.block
+        tiles = (rows // block) * self.tile_cols + cols // block
+        return tiles * (block * block) + (rows % block) * block + cols % block
+
+    def cells(self, positions):
+        block = self.block
+        tiles, offsets = np.divmod(positions, block * block)
+        tile_rows, tile_cols = np.divmod(tiles, self.tile_cols)
+        return tile_rows * block + offsets // block, tile_cols * block + offsets % block
+
+#--------------------------------------- Résultat -----------------------------------
+class DiskSearch:
+    """
+    Résultat d'une recherche hors mémoire : fichiers de murs, distances et
+    directions parentes (le bit du mur franchi vers la cellule parente, 0
+    pour le départ et les cellules non atteintes), rangés par blocs.
+    """
+    __slots__ = ('layout', 'directory', 'owned', 'walls', 'distance', 'parent', 'found')
+
+    def __init__(self, layout, directory, owned):
+        self.layout = layout
+        self.directory = directory
+        self.owned = owned  # répertoire temporaire à supprimer par cleanup()
+        self.walls = self.distance = self.parent = None
+        self.found = False
+
+    def position(self, cell):
+        layout = self.layout
+        return int(layout.positions(cell.index // layout.cols, cell.index % layout.cols))
+
+    def distance_to(self, cell):
+        """
+        Distance du départ à la cellule, ou None si elle n'a pas été atteinte.
+        """
+        value = int(self.distance[self.position(cell)])
+        return None if value == INFINITY else value
+
+    def iter_path(self, end):
+        """
+        Parcourt le chemin depuis le disque, de la fin vers le départ (exclu),
+        en indices de cellules ligne * cols + colonne : seule la cellule
+        courante est en mémoire.
+        """
+        layout = self.layout
+        row, col = divmod(end.index, layout.cols)
+        steps = {TOP: (-1, 0), BOTTOM: (1, 0), LEFT: (0, -1), RIGHT: (0, 1)}
+        if self.distance[layout.positions(row, col)] == INFINITY:
+            return
+        while True:
+            direction = int(self.parent[layout.positions(row, col)])
+            if not direction:
+                return
+            yield row * layout.cols + col
+            delta_row, delta_col = steps[direction]
+            row, col = row + delta_row, col + delta_col
+
+    def path(self, end):
+        """
+        Chemin complet dans l'ordre de reconstruct_p (départ exclu, fin incluse).
+        """
+        cells = list(self.iter_path(end))
+        cells.reverse()
+        return cells
+
+    def cleanup(self):
+        """
+        Ferme les projections et supprime les fichiers si le répertoire était temporaire.
+        """
+        self.walls = self.distance = self.parent = None
+        if self.owned:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cleanup()
+
+#--------------------------------------- Recherche -----------------------------------
+def _grid_rows(grid):
+    # Lignes de masques de murs, sans charger le labyrinthe s'il vient d'un fichier
+    if hasattr(grid.walls, 'iter_rows'):
+        yield from grid.walls.iter_rows()
+        return
+    walls, cols = grid.walls, grid.cols
+    for row in range(grid.rows):
+        yield bytes(walls[row * cols:(row + 1) * cols])
+
+def write_block_walls(grid, layout, path):
+    """
+    Recopie les murs du labyrinthe dans un fichier rangé par blocs, une
+    bande de block lignes à la fois.
+    """
+    block, tile_cols = layout.block, layout.tile_cols
+    walls = np.memmap(path, dtype=np.uint8, mode='w+', shape=(layout.size,))
+    band = np.full((block, tile_cols * block), ALL_WALLS, dtype=np.uint8)
+    band_size = tile_cols * block * block
+    rows = _grid_rows(grid)
+    for tile_row in range(layout.tile_rows):
+        band.fill(ALL_WALLS)
+        for offset in range(min(block, grid.rows - tile_row * block)):
+            band[offset, :grid.cols] = np.frombuffer(next(rows), dtype=np.uint8)
+        tiles = band.reshape(block, tile_cols, block).transpose(1, 0, 2)
+        walls[tile_row * band_size:(tile_row + 1) * band_size] = tiles.ravel()
+    walls.flush()
+    return walls
+
+def disk_bfs(grid, start, end, directory=None, block=DEFAULT_BLOCK):
+    """
+    BFS par fronts triés, avec murs, distances et directions parentes dans
+    des fichiers projetés de directory (un répertoire temporaire par défaut,
+    supprimé par cleanup()). Renvoie un DiskSearch ; s'arrête dès que la fin
+    est atteinte.
+    """
+    owned = directory is None
+    if owned:
+        directory = tempfile.mkdtemp(prefix='labyrinthe-')
+    else:
+        os.makedirs(directory, exist_ok=True)
+
+    layout = BlockLayout(grid.rows, grid.cols, block)
+    search = DiskSearch(layout, directory, owned)
+    walls = search.walls = write_block_walls(grid, layout, os.path.join(directory, 'walls.bin'))
+    distance = search.distance = np.memmap(os.path.join(directory, 'distance.bin'), dtype=np.int32,
+                                           mode='w+', shape=(layout.size,))
+    parent = search.parent = np.memmap(os.path.join(directory, 'parent.bin'), dtype=np.uint8,
+                                       mode='w+', shape=(layout.size,))
+    for begin in range(0, layout.size, FRONTIER_CHUNK):
+        distance[begin:begin + FRONTIER_CHUNK] = INFINITY
+
+    # (mur à franchir, décalage de ligne, décalage de colonne, direction du parent vue du voisin)
+    moves = ((TOP, -1, 0, BOTTOM), (BOTTOM, 1, 0, TOP), (LEFT, 0, -1, RIGHT), (RIGHT, 0, 1, LEFT))
+    start_position = search.position(start)
+    end_position = search.position(end)
+    distance[start_position] = 0
+    frontier = np.array([start_position], dtype=np.int64)
+    step = 0
+
+    while frontier.size and not search.found:
+        step += 1
+        reached, directions = [], []
+        for begin in range(0, frontier.size, FRONTIER_CHUNK):
+            chunk = frontier[begin:begin + FRONTIER_CHUNK]
+            chunk_walls = walls[chunk]
+            rows, cols = layout.cells(chunk)
+            for wall, delta_row, delta_col, back in moves:
+                open_side = (chunk_walls & wall) == 0
+                neighbors = layout.positions(rows[open_side] + delta_row, cols[open_side] + delta_col)
+                fresh = distance[neighbors] == INFINITY
+                reached.append(neighbors[fresh])
+                directions.append(np.full(int(np.count_nonzero(fresh)), back, dtype=np.uint8))
+
+        # Nouveau front trié par position (donc par bloc), sans doublons
+        frontier, first = np.unique(np.concatenate(reached), return_index=True)
+        distance[frontier] = step
+        parent[frontier] = np.concatenate(directions)[first]
+        search.found = bool(distance[end_position] != INFINITY)
+
+    distance.flush()
+    parent.flush()
+    return search
+
+#--------------------------------------- Ligne de commande -----------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Résout un labyrinthe enregistré (Stockage.py) hors mémoire.")
+    parser.add_argument('path', help="fichier de labyrinthe")
+    parser.add_argument('--directory', help="répertoire des fichiers de recherche (temporaire par défaut)")
+    parser.add_argument('--block', type=int, default=DEFAULT_BLOCK, help="côté des blocs de cellules")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    from Stockage import load_maze
+
+    args = parse_args(argv)
+    grid, _ = load_maze(args.path)
+    begin = time.perf_counter()
+    with disk_bfs(grid, grid.cell(0, 0), grid.cell(grid.rows - 1, grid.cols - 1),
+                  args.directory, args.block) as search:
+        elapsed = time.perf_counter() - begin
+        length = sum(1 for _ in search.iter_path(grid.cell(grid.rows - 1, grid.cols - 1)))
+        print(f"{grid.rows} x {grid.cols} : chemin de {length} pas, trouvé en {elapsed:.2f} s")
+
+if __name__ == "__main__":
+    main()
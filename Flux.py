@@ -0,0 +1,265 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Génération et résolution de labyrinthes ligne par ligne, en mémoire O(largeur).
+
+L'algorithme d'Eller produit le labyrinthe une ligne à la fois : seules les
+classes de connexité de la ligne courante sont conservées. Le solveur en
+flux consomme ces lignes dans l'ordre et ne garde qu'une forêt compressée
+dont les sommets sont les cellules de la dernière ligne, le départ,
+l'arrivée et les embranchements qui les relient ; les impasses sont élaguées
+et les couloirs fusionnés en arêtes pondérées au fil de la lecture.
+
+Une ligne est un objet bytes de cols masques de murs, au même codage que
+Maze.walls : un labyrinthe de plusieurs millions de lignes peut ainsi être
+généré, écrit sur disque, relu et résolu sans jamais être chargé en entier.
+
+Exemple :
+    python Flux.py --rows 1000000 --cols 20 --seed 1 --output labyrinthe.bin
+"""
+import argparse
+import os
+import random
+import time
+
+from Moteur import TOP, RIGHT, BOTTOM, LEFT, ALL_WALLS
+
+#--------------------------------------- Génération -----------------------------------
+def eller_rows(rows, cols):
+    """
+    Génère un labyrinthe parfait de rows x cols avec l'algorithme d'Eller et
+    le renvoie ligne par ligne (objets bytes de cols masques de murs).
+    """
+    rand = random.random
+    # Classes de la ligne courante : < cols pour celles héritées de la ligne du dessus,
+    # cols + colonne pour une cellule encore isolée
+    labels = list(range(cols))
+    carried = bytearray(cols)  # passages ouverts vers le bas par la ligne précédente
+
+    for row in range(rows):
+        last = row == rows - 1
+        walls = bytearray([ALL_WALLS]) * cols
+        for col in range(cols):
+            if carried[col]:
+                walls[col] &= ~TOP
+
+        # Union-find sur les classes de la ligne, réinitialisé à chaque ligne
+        parent = list(range(2 * cols))
+
+        def find(label):
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+
+        # Passages horizontaux entre classes différentes (tous sur la dernière ligne)
+        for col in range(cols - 1):
+            a, b = find(labels[col]), find(labels[col + 1])
+            if a != b and (last or rand() < 0.5):
+                walls[col] &= ~RIGHT
+                walls[col + 1] &= ~LEFT
+                parent[b] = a
+
+        if not last:
+            # Passages vers le bas : au moins un par classe
+            members = {}
+            for col in range(cols):
+                members.setdefault(find(labels[col]), []).append(col)
+            carried = bytearray(cols)
+            for columns in members.values():
+                opened = False
+                for col in columns:
+                    if rand() < 0.5:
+                        carried[col] = opened = 1
+                if not opened:
+                    carried[random.choice(columns)] = 1
+                for col in columns:
+                    if carried[col]:
+                        walls[col] &= ~BOTTOM
+
+            # Classes de la ligne suivante, renumérotées sous cols
+            compact = {}
+            labels = [compact.setdefault(find(labels[col]), len(compact)) if carried[col] else cols + col
+                      for col in range(cols)]
+
+        yield bytes(walls)
+
+def generate_eller(grid):
+    """
+    Remplit un labyrinthe complet avec l'algorithme d'Eller (mêmes lignes que eller_rows).
+    """
+    walls, cols = grid.walls, grid.cols
+    for row, line in enumerate(eller_rows(grid.rows, cols)):
+        walls[row * cols:(row + 1) * cols] = line
+    grid.freeze()
+
+#--------------------------------------- Lignes sur disque -----------------------------------
+def write_rows(rows, path):
+    """
+    Écrit chaque ligne dans le fichier path au moment où elle passe, puis la
+    transmet : write_rows(eller_rows(...), path) s'insère dans un flux existant.
+    """
+    with open(path, 'wb') as output:
+        for line in rows:
+            output.write(line)
+            yield line
+
+def read_rows(path, cols):
+    """
+    Relit ligne par ligne un labyrinthe écrit par write_rows.
+    """
+    with open(path, 'rb') as source:
+        while True:
+            line = source.read(cols)
+            if len(line) < cols:
+                if line:
+                    raise ValueError("fichier tronqué : dernière ligne incomplète")
+                return
+            yield line
+
+#--------------------------------------- Résolution en flux -----------------------------------
+def stream_solve(rows, cols, start, end, with_path=False):
+    """
+    Résout un labyrinthe parfait fourni ligne par ligne, sans le charger.
+
+    rows est un itérable de lignes (bytes), start et end des couples (ligne,
+    colonne). Renvoie (distance, chemin) : distance est le nombre de pas du
+    départ à l'arrivée, ou None s'ils ne sont pas reliés. Le chemin (indices
+    ligne * cols + colonne, départ exclu, comme reconstruct_p) n'est construit
+    qu'avec with_path=True ; sa mémoire croît alors avec la longueur des
+    couloirs qui relient le départ et l'arrivée à la ligne courante.
+
+    Seule la forêt compressée est conservée : O(cols) sommets. Un cycle dans
+    les lignes lues lève ValueError (labyrinthe non parfait).
+    """
+    start_index = start[0] * cols + start[1]
+    end_index = end[0] * cols + end[1]
+    start_node = end_node = None
+
+    # Forêt compressée : sommets = indices de cellules, arêtes pondérées par leur nombre de pas
+    adjacency = {}
+    segments = {}    # (a, b) avec a < b -> cellules intérieures de a vers b (avec with_path)
+    component = {}   # sommet -> classe de connexité, pour détecter les cycles
+    frontier = []
+
+    def oriented(a, b):
+        cells = segments[(a, b) if a < b else (b, a)]
+        return cells if a < b else cells[::-1]
+
+    def compress(candidates, protected):
+        # Élague les impasses et fusionne les couloirs qui ne mènent à aucun sommet protégé
+        stack = list(candidates)
+        while stack:
+            node = stack.pop()
+            if node in protected or node not in adjacency:
+                continue
+            neighbors = adjacency[node]
+            if len(neighbors) > 2:
+                continue
+            if len(neighbors) == 2:
+                (a, weight_a), (b, weight_b) = neighbors.items()
+                del adjacency[a][node], adjacency[b][node]
+                adjacency[a][b] = adjacency[b][a] = weight_a + weight_b
+                if with_path:
+                    cells = oriented(a, node) + [node] + oriented(node, b)
+                    del segments[(a, node) if a < node else (node, a)]
+                    del segments[(b, node) if b < node else (node, b)]
+                    segments[(a, b) if a < b else (b, a)] = cells if a < b else cells[::-1]
+            elif neighbors:
+                (other,) = neighbors
+                del adjacency[other][node]
+                if with_path:
+                    del segments[(other, node) if other < node else (node, other)]
+                stack.append(other)
+            del adjacency[node], component[node]
+
+    row = -1
+    for row, line in enumerate(rows):
+        base = row * cols
+        current = list(range(base, base + cols))
+        for node in current:
+            adjacency[node] = {}
+            component[node] = node
+
+        # Classes de connexité des sommets vivants, fusionnées par les arêtes de la ligne
+        parent = {}
+
+        def find(label):
+            while parent.get(label, label) != label:
+                label = parent[label]
+            return label
+
+        def link(a, b):
+            root_a, root_b = find(component[a]), find(component[b])
+            if root_a == root_b:
+                raise ValueError(f"cycle détecté à la ligne {row} : le labyrinthe n'est pas parfait")
+            parent[root_b] = root_a
+            adjacency[a][b] = adjacency[b][a] = 1
+            if with_path:
+                segments[(a, b) if a < b else (b, a)] = []
+
+        for col in range(cols):
+            if frontier and not line[col] & TOP:
+                link(frontier[col], current[col])
+            if col < cols - 1 and not line[col] & RIGHT:
+                link(current[col], current[col + 1])
+        for node in component:
+            component[node] = find(component[node])
+
+        if base <= start_index < base + cols:
+            start_node = start_index
+        if base <= end_index < base + cols:
+            end_node = end_index
+
+        compress(frontier, {start_node, end_node, *current})
+        frontier = current
+
+    compress(frontier, {start_node, end_node})
+
+    if start_node is None or end_node is None:
+        raise ValueError(f"départ ou arrivée hors des {row + 1} lignes lues")
+    if start_node == end_node:
+        return 0, [] if with_path else None
+    weight = adjacency[start_node].get(end_node)
+    if weight is None:
+        return None, None
+    return weight, oriented(start_node, end_node) + [end_node] if with_path else None
+
+#--------------------------------------- Ligne de commande -----------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Génère et résout un labyrinthe ligne par ligne.")
+    parser.add_argument('--rows', type=int, help="nombre de lignes (1000 par défaut ; déduit de la taille du fichier avec --input)")
+    parser.add_argument('--cols', type=int, default=20, help="nombre de colonnes")
+    parser.add_argument('--seed', type=int, help="graine de la génération")
+    parser.add_argument('--output', help="fichier où écrire les lignes au fil de la génération")
+    parser.add_argument('--input', help="fichier de lignes à résoudre au lieu d'en générer")
+    args = parser.parse_args(argv)
+    if args.input:
+        if args.rows is not None:
+            parser.error("--rows ne s'utilise pas avec --input : le nombre de lignes vient de la taille du fichier")
+        size = os.path.getsize(args.input)
+        if size == 0 or size % args.cols:
+            parser.error(f"{args.input} : {size} octets, pas un nombre entier de lignes de {args.cols} colonnes")
+        args.rows = size // args.cols
+    elif args.rows is None:
+        args.rows = 1000
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.input:
+        rows = read_rows(args.input, args.cols)
+    else:
+        if args.seed is not None:
+            random.seed(args.seed)
+        rows = eller_rows(args.rows, args.cols)
+        if args.output:
+            rows = write_rows(rows, args.output)
+
+    begin = time.perf_counter()
+    distance, _ = stream_solve(rows, args.cols, (0, 0), (args.rows - 1, args.cols - 1))
+    elapsed = time.perf_counter() - begin
+    print(f"{args.rows} x {args.cols} : distance {distance if distance is not None else '-'} "
+          f"du coin haut gauche au coin bas droit, {elapsed:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 #--------------------------------------- Importations et Constantes -----------------------------------
 import pygame
 import random
-import heapq
-from math import sqrt
 import sys
 import time
+import weakref
+from collections import OrderedDict
+
+from Moteur import SearchState
+from Algorithmes import ALGORITHMS, GENERATORS, STEPPERS, generate_maze, prepare_maze
+from Tache import SolveTask
 
 # Constantes d'affichage
 WIDTH, HEIGHT = 600, 600
@@ -22,34 +26,111 @@ GREEN = (0, 255, 0)
 RED = (255, 0, 0)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
-HOVER_COLOR = BLUE  # Couleur des boutons lorsqu'ils sont survolés
+# Animation des chemins : un pas toutes les STEP_MS ms, sans dépasser PATH_ANIMATION_MS au total
+STEP_MS = 50
+PATH_ANIMATION_MS = 3000
+FPS = 60
+# Résolution en arrière-plan : l'avancement n'est affiché qu'au-delà de PROGRESS_DELAY secondes,
+# et rafraîchi PROGRESS_FPS fois par seconde pour laisser le processeur aux recherches
+PROGRESS_DELAY = 0.2
+PROGRESS_FPS = 10
+# Exploration pas à pas : un labyrinthe entier en EXPLORATION_MS ms au plus vite,
+# sans dépasser FRAME_BUDGET_MS ms de calcul et de dessin par image
+EXPLORATION_MS = 4000
+FRAME_BUDGET_MS = 8
 
-# Initialisation de Pygame
-pygame.init()
-pygame.mixer.init()
-pygame.display.set_caption("Le Labyrinthe")
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-font = pygame.font.SysFont(None, 40)
-
-# Charger l'image de fond
-background_image = pygame.image.load("image/BR.jpeg")
-background_image = pygame.transform.scale(background_image, (WINDOW_WIDTH, WINDOW_HEIGHT))
-
-# Charger les fichiers audio
-sound_Click_start = pygame.mixer.Sound("Son/StartButton.wav")
-sound_click = pygame.mixer.Sound("Son/ClickButton.wav")
-sound_hover = pygame.mixer.Sound("Son/HoverButton.wav")
-sound_start = pygame.mixer.Sound("Son/Lancement.mp3")
-pygame.mixer.music.load("Son/BackSound.mp3")
+HOVER_COLOR = BLUE  # Couleur des boutons lorsqu'ils sont survolés
+EXPLORED_COLOR = (40, 60, 110)  # Couleur des cellules développées par une recherche
+SELECTED_COLOR = (0, 100, 0)  # Couleur de l'option sélectionnée
+
+# Ressources Pygame, initialisées paresseusement par init_display()
+screen = None
+font = None
+background_image = None
+sound_Click_start = sound_click = sound_hover = sound_start = None
 StartSound1 = True
 StartSound2 = True
 
-# Réglage du volume des effets sonores (0.0 pour muet, 1.0 pour volume maximal)
-sound_Click_start.set_volume(0.7)  # Volume à 70% pour le clic sur le bouton "Commencer"
-sound_click.set_volume(0.7)        # Volume à 70% pour le clic des autres boutons
-sound_hover.set_volume(0.5)        # Volume à 50% pour le son de survol
-sound_start.set_volume(0.3)        # Volume à 30% pour le son de démarrage
-pygame.mixer.music.set_volume(0.4)
+# Nombre maximal de textes rendus gardés en mémoire par le cache de rendu
+TEXT_CACHE_SIZE = 256
+
+# Couche statique du labyrinthe (fond, murs, départ et arrivée), dessinée une fois par labyrinthe
+maze_layer_cache = None
+maze_layer_key = None
+
+def init_display():
+    """
+    Initialise Pygame, la fenêtre, l'image de fond et les sons.
+    Appelée uniquement au lancement du jeu interactif, pour que l'import du
+    module ne requière ni écran ni périphérique audio.
+    """
+    global screen, font, background_image
+    global sound_Click_start, sound_click, sound_hover, sound_start
+
+    if screen is not None:
+        return
+
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_caption("Le Labyrinthe")
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    font = pygame.font.SysFont(None, 40)
+
+    # Charger l'image de fond
+    background_image = pygame.image.load("image/BR.jpeg")
+    background_image = pygame.transform.scale(background_image, (WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    # Charger les fichiers audio
+    sound_Click_start = pygame.mixer.Sound("Son/StartButton.wav")
+    sound_click = pygame.mixer.Sound("Son/ClickButton.wav")
+    sound_hover = pygame.mixer.Sound("Son/HoverButton.wav")
+    sound_start = pygame.mixer.Sound("Son/Lancement.mp3")
+    pygame.mixer.music.load("Son/BackSound.mp3")
+
+    # Réglage du volume des effets sonores (0.0 pour muet, 1.0 pour volume maximal)
+    sound_Click_start.set_volume(0.7)  # Volume à 70% pour le clic sur le bouton "Commencer"
+    sound_click.set_volume(0.7)        # Volume à 70% pour le clic des autres boutons
+    sound_hover.set_volume(0.5)        # Volume à 50% pour le son de survol
+    sound_start.set_volume(0.3)        # Volume à 30% pour le son de démarrage
+    pygame.mixer.music.set_volume(0.4)
+
+#--------------------------------------- Cache de rendu du texte -----------------------------------
+class TextCache:
+    """
+    Cache des polices chargées et des textes rendus, indexés par (taille, texte, couleur).
+    Les polices, peu nombreuses, sont gardées ; au-delà de max_entries textes,
+    le moins récemment utilisé est évincé, pour que les textes variables
+    (durées, compteurs) ne fassent pas grossir le cache sans limite.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+
+    def font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, size, text, color):
+        key = (size, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = self.surfaces[key] = self.font(size).render(text, True, color)
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+text_cache = TextCache()
+
+def render_text(size, text, color):
+    """
+    Rend un texte avec la police par défaut de la taille donnée, via le cache partagé.
+    """
+    return text_cache.render(size, text, color)
 
 #--------------------------------------- Classe ButtonHandler avec anti-rebonds -----------------------------------
 class ButtonHandler:
@@ -64,38 +145,31 @@ class ButtonHandler:
         # États des boutons de la souris
         self.mouse_state = {"left": False, "middle": False, "right": False}
 
-    def is_clicked(self, button_rect, button_number=1):
+    def is_click_event(self, event, button_rect, button_number=1):
         """
-        Vérifie si un bouton a été cliqué sans rebond et retourne True si un clic valide est détecté.
+        Vérifie si l'événement est un clic valide dans la zone du bouton, en
+        ignorant les clics plus rapprochés que debounce_time.
+        :param event: événement Pygame
         :param button_rect: pygame.Rect représentant la zone du bouton
         :param button_number: 1 pour gauche, 2 pour milieu, 3 pour droit
         :return: True si un clic valide est détecté, False sinon
         """
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
-
-        # Nom du bouton selon son numéro
         button_name = {1: "left", 2: "middle", 3: "right"}.get(button_number, "left")
 
-        # Si la souris est enfoncée dans la zone du bouton
-        if mouse_buttons[button_number - 1] and button_rect.collidepoint(mouse_pos):
-            # Temps actuel
-            current_time = time.time()
-
-            # Vérifier si le clic est "valide" selon le temps de debounce
-            if (button_name not in self.last_click_time or
-                current_time - self.last_click_time[button_name] > self.debounce_time):
-                
-                # Enregistrer l'heure du dernier clic pour ce bouton
-                self.last_click_time[button_name] = current_time
-
-                # Mettre à jour l'état du bouton
-                self.mouse_state[button_name] = True
-                return True
-        else:
-            # Mettre à jour l'état du bouton quand il n'est pas enfoncé
+        if event.type == pygame.MOUSEBUTTONUP and event.button == button_number:
             self.mouse_state[button_name] = False
-        
+            return False
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != button_number:
+            return False
+        if not button_rect.collidepoint(event.pos):
+            return False
+
+        current_time = time.time()
+        if (button_name not in self.last_click_time or
+            current_time - self.last_click_time[button_name] > self.debounce_time):
+            self.last_click_time[button_name] = current_time
+            self.mouse_state[button_name] = True
+            return True
         return False
 
 button_handler = ButtonHandler()  # Création de l'instance pour gérer les clics avec anti-rebonds
@@ -106,36 +180,6 @@ def evntQ():
                 pygame.quit()
                 sys.exit()
 #--------------------------------------- Classes -----------------------------------
-class Cell:
-    """
-    Représente une cellule dans le labyrinthe avec ses propriétés
-    de murs et d'état de visite.
-    """
-    def __init__(self, row, col):
-        self.row = row
-        self.col = col
-        self.visited = False
-        self.walls = {'top': True, 'right': True, 'bottom': True, 'left': True}
-        self.distance = float('inf')
-        self.previous = None
-        self.f_cost = 0
-
-    def draw(self, color=WHITE):
-        x = EXTRA_WIDTH + self.col * CELL_SIZE
-        y = EXTRA_HEIGHT + self.row * CELL_SIZE
-        if self.walls['top']:
-            pygame.draw.line(screen, color, (x, y), (x + CELL_SIZE, y), 2)
-        if self.walls['right']:
-            pygame.draw.line(screen, color, (x + CELL_SIZE, y), (x + CELL_SIZE, y + CELL_SIZE), 2)
-        if self.walls['bottom']:
-            pygame.draw.line(screen, color, (x, y + CELL_SIZE), (x + CELL_SIZE, y + CELL_SIZE), 2)
-        if self.walls['left']:
-            pygame.draw.line(screen, color, (x, y), (x, y + CELL_SIZE), 2)
-
-    def __lt__(self, other):
-        return self.distance < other.distance
-
-
 class Button:
     """
     Représente un bouton cliquable avec changement de couleur au survol.
@@ -163,8 +207,7 @@ class Button:
         self.hovered_last_frame = self.is_hovered
 
         # Afficher le texte du bouton
-        font = pygame.font.Font(None, 36)
-        text_surface = font.render(self.text, True, WHITE)
+        text_surface = render_text(36, self.text, WHITE)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -172,75 +215,60 @@ class Button:
         # Met à jour l'état survolé en fonction de la position de la souris
         self.is_hovered = self.rect.collidepoint(mouse_pos)
 
-#--------------------------------------- Génération du Labyrinthe -----------------------------------
-def generate_lab(grid):
+#--------------------------------------- Boucle des Menus -----------------------------------
+def wait_for_click(buttons, draw_background=None):
     """
-    Génère un labyrinthe en utilisant un algorithme de backtracking avec une pile.
-    """
-    stack = []
-    current = grid[0][0]
-    current.visited = True
+    Attend un clic valide sur l'un des boutons et renvoie ce bouton.
 
+    La boucle est pilotée par les événements : pygame.event.wait endort le
+    processus jusqu'au prochain événement, l'écran n'est redessiné qu'au
+    premier affichage et lorsque l'état de survol d'un bouton change, et les
+    clics viennent des événements MOUSEBUTTONDOWN, filtrés par l'anti-rebonds.
+    draw_background, s'il est fourni, redessine le fond avant les boutons.
+    """
+    mouse_pos = pygame.mouse.get_pos()
+    redraw = True
     while True:
-        next_cell = get_next_unvisited_neighbor(grid, current)
-        if next_cell:
-            stack.append(current)
-            remove_walls(current, next_cell)
-            next_cell.visited = True
-            current = next_cell
-        elif stack:
-            current = stack.pop()
+        if redraw:
+            if draw_background is not None:
+                draw_background()
+            for button in buttons:
+                button.check_hover(mouse_pos)
+                button.draw()
+            pygame.display.update()
+            redraw = False
+
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        elif event.type == pygame.MOUSEMOTION:
+            mouse_pos = event.pos
+            redraw = any(button.rect.collidepoint(mouse_pos) != button.is_hovered for button in buttons)
+        elif event.type == pygame.VIDEOEXPOSE:
+            redraw = True
         else:
-            break
-
-def get_next_unvisited_neighbor(grid, current):
-    """
-    Récupère un voisin non visité au hasard autour de la cellule actuelle.
-    """
-    neighbors = []
-    row, col = current.row, current.col
-    if row > 0 and not grid[row - 1][col].visited:
-        neighbors.append(grid[row - 1][col])
-    if row < ROWS - 1 and not grid[row + 1][col].visited:
-        neighbors.append(grid[row + 1][col])
-    if col > 0 and not grid[row][col - 1].visited:
-        neighbors.append(grid[row][col - 1])
-    if col < COLS - 1 and not grid[row][col + 1].visited:
-        neighbors.append(grid[row][col + 1])
-
-    return random.choice(neighbors) if neighbors else None
-
-def remove_walls(current, next_cell):
-    """
-    Enlève les murs entre deux cellules adjacentes.
-    """
-    dx = current.col - next_cell.col
-    dy = current.row - next_cell.row
-
-    if dx == 1:
-        current.walls['left'] = False
-        next_cell.walls['right'] = False
-    elif dx == -1:
-        current.walls['right'] = False
-        next_cell.walls['left'] = False
-    elif dy == 1:
-        current.walls['top'] = False
-        next_cell.walls['bottom'] = False
-    elif dy == -1:
-        current.walls['bottom'] = False
-        next_cell.walls['top'] = False
-
-def reset_grid(grid):
-    """
-    Réinitialise le labyrinthe pour une nouvelle recherche.
-    """
-    for row in grid:
-        for cell in row:
-            cell.visited = False
-            cell.distance = float('inf')
-            cell.previous = None
+            for button in buttons:
+                if button_handler.is_click_event(event, button.rect):
+                    return button
 
 #--------------------------------------- Dessin du Labyrinthe et des Objets -----------------------------------
+def draw_cell(cell, color=WHITE, surface=None):
+    """
+    Dessine les murs d'une cellule du labyrinthe (sur l'écran par défaut).
+    """
+    target = screen if surface is None else surface
+    x = EXTRA_WIDTH + cell.col * CELL_SIZE
+    y = EXTRA_HEIGHT + cell.row * CELL_SIZE
+    if cell.walls['top']:
+        pygame.draw.line(target, color, (x, y), (x + CELL_SIZE, y), 2)
+    if cell.walls['right']:
+        pygame.draw.line(target, color, (x + CELL_SIZE, y), (x + CELL_SIZE, y + CELL_SIZE), 2)
+    if cell.walls['bottom']:
+        pygame.draw.line(target, color, (x, y + CELL_SIZE), (x + CELL_SIZE, y + CELL_SIZE), 2)
+    if cell.walls['left']:
+        pygame.draw.line(target, color, (x, y), (x, y + CELL_SIZE), 2)
+
 def draw_ball(cell, color=RED):
     """
     Dessine une balle rouge pour représenter la position actuelle dans le labyrinthe.
@@ -249,190 +277,153 @@ def draw_ball(cell, color=RED):
     y = EXTRA_HEIGHT + cell.row * CELL_SIZE + CELL_SIZE // 2
     pygame.draw.circle(screen, color, (x, y), CELL_SIZE // 4)
 
-def draw_start_end(start, end):
+def draw_start_end(start, end, surface=None):
     """
-    Dessine les points de départ et de fin.
+    Dessine les points de départ et de fin (sur l'écran par défaut).
+    Renvoie les rectangles touchés.
     """
+    target = screen if surface is None else surface
     start_x = EXTRA_WIDTH + start.col * CELL_SIZE + CELL_SIZE // 2 
     start_y = EXTRA_HEIGHT + start.row * CELL_SIZE + CELL_SIZE // 2 + 20
     end_x = EXTRA_WIDTH + end.col * CELL_SIZE + CELL_SIZE // 2
     end_y = EXTRA_HEIGHT + end.row * CELL_SIZE + CELL_SIZE // 2 + 20
 
-    pygame.draw.polygon(screen, BLUE, [(start_x, start_y - 20), (start_x - 10, start_y - 30), (start_x + 10, start_y - 30)])
-    pygame.draw.polygon(screen, YELLOW, [(end_x, end_y - 20), (end_x - 10, end_y - 30), (end_x + 10, end_y - 30)])
-
-#--------------------------------------- Algorithmes de Recherche -----------------------------------
-def copy_grid(grid):
-    """
-    Crée une copie du labyrinthe pour chaque algorithme.
-    """
-    grid_copy = [[Cell(cell.row, cell.col) for cell in row] for row in grid]
-    for r in range(ROWS):
-        for c in range(COLS):
-            grid_copy[r][c].walls = grid[r][c].walls.copy()  # Copier aussi les murs
-    return grid_copy
-
-def dijkstra(grid, start, end):
-    """
-    Algorithme de Dijkstra pour trouver le chemin le plus court.
-    """
-    start.distance = 0
-    queue = []
-    heapq.heappush(queue, (start.distance, start))
-
-    while queue:
-        _, current = heapq.heappop(queue)
-
-        if current == end:
-            return True
-
-        for neighbor in get_neighbors(grid, current):
-            temp_distance = current.distance + 1
-            if temp_distance < neighbor.distance:
-                neighbor.distance = temp_distance
-                neighbor.previous = current
-                heapq.heappush(queue, (neighbor.distance, neighbor))
-
-    return False
+    return [pygame.draw.polygon(target, BLUE, [(start_x, start_y - 20), (start_x - 10, start_y - 30), (start_x + 10, start_y - 30)]),
+            pygame.draw.polygon(target, YELLOW, [(end_x, end_y - 20), (end_x - 10, end_y - 30), (end_x + 10, end_y - 30)])]
 
-def a_star(grid, start, end):
+def maze_layer(grid, start, end):
     """
-    Algorithme A* pour trouver le chemin le plus court.
+    Renvoie la couche statique du labyrinthe (fond, murs, départ et arrivée),
+    dessinée hors écran une seule fois. Elle n'est redessinée que si le
+    labyrinthe, ses extrémités ou la taille de la fenêtre changent.
     """
-    open_set = []
-    heapq.heappush(open_set, (0, start))
-    start.distance = 0
+    global maze_layer_cache, maze_layer_key
+    key = (start.index, end.index, screen.get_size(), CELL_SIZE)
+    if maze_layer_cache is not None and maze_layer_key[0]() is grid and maze_layer_key[1:] == key:
+        return maze_layer_cache
 
-    while open_set:
-        _, current = heapq.heappop(open_set)
-
-        if current == end:
-            return True
-
-        for neighbor in get_neighbors(grid, current):
-            tentative_g_score = current.distance + 1
-            if tentative_g_score < neighbor.distance:
-                neighbor.distance = tentative_g_score
-                neighbor.f_cost = tentative_g_score + heuristic(neighbor, end)
-                neighbor.previous = current
-                heapq.heappush(open_set, (neighbor.f_cost, neighbor))
+    layer = pygame.Surface(screen.get_size()).convert()
+    layer.blit(background_image, (0, 0))
+    pygame.draw.rect(layer, BLACK, (EXTRA_WIDTH, EXTRA_HEIGHT, WIDTH, HEIGHT))
+    for row in grid:
+        for cell in row:
+            draw_cell(cell, surface=layer)
+    draw_start_end(start, end, surface=layer)
 
-    return False
+    # Référence faible : le cache ne retient pas un labyrinthe abandonné
+    maze_layer_cache, maze_layer_key = layer, (weakref.ref(grid),) + key
+    return layer
 
-def bfs(grid, start, end):
+def cell_center(cell):
     """
-    Algorithme BFS (Breadth-First Search) pour trouver le chemin le plus court.
+    Coordonnées à l'écran du centre d'une cellule.
     """
-    queue = [start]
-    start.distance = 0
-    start.visited = True
+    return (EXTRA_WIDTH + cell.col * CELL_SIZE + CELL_SIZE // 2,
+            EXTRA_HEIGHT + cell.row * CELL_SIZE + CELL_SIZE // 2)
 
-    while queue:
-        current = queue.pop(0)
-
-        if current == end:
-            return True
-
-        for neighbor in get_neighbors(grid, current):
-            if not neighbor.visited:
-                neighbor.visited = True
-                neighbor.distance = current.distance + 1
-                neighbor.previous = current
-                queue.append(neighbor)
-
-    return False
-
-def dfs(grid, start, end):
+def animate_exploration(grid, start, end, steps):
     """
-    Algorithme DFS (Depth-First Search) pour explorer le labyrinthe.
-    """
-    stack = [start]
-    start.visited = True
-
-    while stack:
-        current = stack.pop()
-
-        if current == end:
-            return True
+    Anime une recherche pas à pas (générateur *_steps de Moteur.py) sur une copie
+    de la couche statique du labyrinthe, et renvoie cette copie.
 
-        for neighbor in get_neighbors(grid, current):
-            if not neighbor.visited:
-                neighbor.visited = True
-                neighbor.previous = current
-                stack.append(neighbor)
-
-    return False
-
-def get_neighbors(grid, cell):
-    """
-    Récupère les voisins accessibles d'une cellule.
+    À chaque image, autant de pas que le permet la cadence (EXPLORATION_MS
+    pour un labyrinthe entier) sont consommés, sans dépasser FRAME_BUDGET_MS ;
+    seules les cellules nouvellement développées sont peintes puis recopiées à
+    l'écran. Aucun historique n'est gardé : la copie est la seule trace de l'exploration.
     """
-    neighbors = []
-    row, col = cell.row, cell.col
-    if row > 0 and not cell.walls['top']:
-        neighbors.append(grid[row - 1][col])
-    if row < ROWS - 1 and not cell.walls['bottom']:
-        neighbors.append(grid[row + 1][col])
-    if col > 0 and not cell.walls['left']:
-        neighbors.append(grid[row][col - 1])
-    if col < COLS - 1 and not cell.walls['right']:
-        neighbors.append(grid[row][col + 1])
-    return neighbors
+    explored = maze_layer(grid, start, end).copy()
+    screen.blit(explored, (0, 0))
+    pygame.display.update()
 
-def heuristic(cell, end):
-    """
-    Heuristique pour l'algorithme A* (distance euclidienne).
-    """
-    return sqrt((cell.row - end.row) ** 2 + (cell.col - end.col) ** 2)
+    cols = grid.cols
+    inset = 2 if CELL_SIZE > 4 else 0  # Laisse les murs visibles autour des cellules peintes
+    side = max(CELL_SIZE - inset, 1)
+    rate = grid.rows * cols / EXPLORATION_MS  # Cellules par milliseconde
+
+    clock = pygame.time.Clock()
+    begin = pygame.time.get_ticks()
+    consumed = 0
+    finished = False
+    while not finished:
+        clock.tick(FPS)
+        evntQ()
+        target = int((pygame.time.get_ticks() - begin) * rate) + 1
+        deadline = time.perf_counter() + FRAME_BUDGET_MS / 1000
+
+        dirty = []
+        while consumed < target:
+            index = next(steps, None)
+            if index is None:
+                finished = True
+                break
+            consumed += 1
+            row, col = divmod(index, cols)
+            dirty.append(explored.fill(EXPLORED_COLOR, (EXTRA_WIDTH + col * CELL_SIZE + inset,
+                                                        EXTRA_HEIGHT + row * CELL_SIZE + inset, side, side)))
+            if not consumed & 63 and time.perf_counter() > deadline:
+                break
+
+        if dirty:
+            dirty += draw_start_end(start, end, surface=explored)
+            for rect in dirty:
+                screen.blit(explored, rect, rect)
+            pygame.display.update(dirty)
+
+    return explored
+
+def animate_paths(grid, start, end, paths, background=None):
+    """
+    Anime le tracé d'un ou plusieurs chemins sur la couche statique du
+    labyrinthe, ou sur background (par exemple la surface d'animate_exploration).
+
+    La durée est fixe (un pas toutes les STEP_MS ms, PATH_ANIMATION_MS au plus) :
+    les longs chemins avancent de plusieurs cellules par image. Les traits sont
+    accumulés sur une copie de la couche, et seuls les rectangles touchés par
+    les nouveaux segments et par les balles sont recopiés à l'écran.
+    """
+    layer = maze_layer(grid, start, end) if background is None else background
+    trail = layer.copy()
+    screen.blit(layer, (0, 0))
+    pygame.display.update()
 
-def reconstruct_p(end):
-    """
-    Reconstruit le chemin trouvé à partir de la cellule de fin.
-    """
-    path = []
-    current = end
-    while current.previous:
-        path.append(current)
-        current = current.previous
-    path.reverse()
-    return path
+    points = [[cell_center(cell) for cell in path] for path in paths]
+    longest = max((len(path_points) for path_points in points), default=0)
+    if not longest:
+        return
+    duration = min(longest * STEP_MS, PATH_ANIMATION_MS)
+    radius = CELL_SIZE // 4
+
+    clock = pygame.time.Clock()
+    begin = pygame.time.get_ticks()
+    shown = 0
+    balls = []
+    while shown < longest:
+        clock.tick(FPS)
+        evntQ()
+        target = min(longest, (pygame.time.get_ticks() - begin) * longest // duration + 1)
+        if target == shown:
+            continue
+
+        # Nouveaux segments tracés sur la copie, puis recopiés avec les anciennes balles
+        dirty = list(balls)
+        for path_points in points:
+            segment = path_points[max(shown - 1, 0):target]
+            if len(segment) > 1:
+                dirty.append(pygame.draw.lines(trail, RED, False, segment, 3).inflate(2, 2))
+        for rect in dirty:
+            screen.blit(trail, rect, rect)
+
+        balls = [pygame.draw.circle(screen, RED, path_points[min(target, len(path_points)) - 1], radius)
+                 for path_points in points if path_points]
+        pygame.display.update(dirty + balls)
+        shown = target
 
 #--------------------------------------- Comparaison des Algorithmes -----------------------------------
 def display_comparison_animation(grid, start, end, results):
     """
     Affiche une animation de comparaison visuelle des algorithmes avec un effet "serpent".
     """
-    max_path_length = max(len(res[3]) for res in results)
-
-    path_points = {algo_name: [] for algo_name, _, _, _ in results}
-
-    for step in range(max_path_length):
-        screen.blit(background_image, (0, 0))
-        pygame.draw.rect(screen, BLACK, (EXTRA_WIDTH, EXTRA_HEIGHT, WIDTH, HEIGHT))
-
-        for row in grid:
-            for cell in row:
-                cell.draw()
-
-        draw_start_end(start, end)
-
-        for algo_name, elapsed_time, color, path in results:
-            if step < len(path):
-                cell = path[step]
-                x = EXTRA_WIDTH + cell.col * CELL_SIZE + CELL_SIZE // 2
-                y = EXTRA_HEIGHT + cell.row * CELL_SIZE + CELL_SIZE // 2
-
-                path_points[algo_name].append((x, y))
-
-                if len(path_points[algo_name]) > 1:
-                    pygame.draw.lines(screen, RED, False, path_points[algo_name], 3)  # Tracer la ligne
-
-                pygame.draw.circle(screen, RED, (x, y), CELL_SIZE // 4)
-
-                evntQ();
-        # Mise à jour
-        pygame.display.update()
-        pygame.time.delay(50)
+    animate_paths(grid, start, end, [path for _, _, _, path, _ in results])
 
 def display_comparison_results(results):
     """
@@ -443,50 +434,97 @@ def display_comparison_results(results):
 
     # Afficher les résultats
     screen.blit(background_image, (0, 0))
-    font = pygame.font.Font(None, 36)
     y_offset = 100
 
-    title_surface = font.render("Résultats de la comparaison :", True, WHITE)
+    title_surface = render_text(36, "Résultats de la comparaison :", WHITE)
     screen.blit(title_surface, (50, y_offset))
     y_offset += 50
 
-    for rank, (algo_name, elapsed_time, color, _) in enumerate(sorted_results):
+    for rank, (algo_name, elapsed_time, color, _, stats) in enumerate(sorted_results):
         result_text = f"{rank + 1}. {algo_name} - Temps : {elapsed_time*(10**6):.2f} us"
-        text_surface = font.render(result_text, True, color)
+        text_surface = render_text(36, result_text, color)
         screen.blit(text_surface, (50, y_offset))
+        stats_surface = render_text(22, format_stats(stats), color)
+        screen.blit(stats_surface, (80, y_offset + 24))
         y_offset += 50
 
     pygame.display.update()
 
-def compare_algorithms_animation(grid, start, end):
+def compare_algorithms_animation(grid, start, end, parallel=False):
     """
-    Lance la comparaison des différents algorithmes et renvoie les résultats.
+    Lance la comparaison des différents algorithmes en arrière-plan et renvoie
+    les résultats, ou None si le joueur a annulé.
+    Avec parallel=True, les algorithmes sont répartis sur plusieurs processus.
     """
-    algorithms = [
-        ('Dijkstra', dijkstra, BLACK),
-        ('A*', a_star, BLACK),
-        ('BFS', bfs, BLACK),
-        ('DFS', dfs, BLACK)
-    ]
+    results = run_task(SolveTask(grid, start, end, ALGORITHMS, parallel), grid, start, end)
+    if results is None:
+        return None
+    return [(ALGORITHMS[key][0], elapsed_time if found else float('inf'), BLACK, path, stats)
+            for key, elapsed_time, found, path, stats in results]
 
-    results = []
-    for algo_name, algo_func, color in algorithms:
-        grid_copy = copy_grid(grid)
-        reset_grid(grid_copy)
+def draw_progress_panel(completed, total, expanded, elapsed):
+    """
+    Affiche l'avancement d'une résolution en arrière-plan en bas de l'écran.
+    Renvoie le rectangle du panneau.
+    """
+    panel_rect = pygame.Rect(0, WINDOW_HEIGHT - 50, WINDOW_WIDTH, 50)
+    pygame.draw.rect(screen, BLACK, panel_rect)
 
-        start_time = time.time()
-        found = algo_func(grid_copy, grid_copy[start.row][start.col], grid_copy[end.row][end.col])
-        elapsed_time = time.time() - start_time
+    info_text = f"Recherche {min(completed + 1, total)} / {total} | Cellules développées : {expanded} | {elapsed:.1f} s"
+    text_surface = render_text(30, info_text, WHITE)
+    screen.blit(text_surface, (20, WINDOW_HEIGHT - 38))
+    return panel_rect
 
-        if found:
-            path = reconstruct_p(grid_copy[end.row][end.col])
-            results.append((algo_name, elapsed_time, color, path))
-        else:
-            results.append((algo_name, float('inf'), color, []))
+def run_task(task, grid, start, end):
+    """
+    Démarre une tâche de résolution et garde la fenêtre réactive jusqu'à sa fin.
 
-    return results
+    Si la tâche dure plus de PROGRESS_DELAY secondes, la couche du labyrinthe
+    est affichée avec un panneau d'avancement et un bouton "Annuler" ; la
+    boucle est cadencée à PROGRESS_FPS pour prendre le moins de temps possible
+    aux recherches. Renvoie les résultats de la tâche, ou None si elle a été annulée.
+    """
+    task.start()
+    if not task.wait(PROGRESS_DELAY):
+        cancel_button = Button((WINDOW_WIDTH - 200) // 2, (WINDOW_HEIGHT - 50) // 2, 200, 50, RED, 'Annuler')
+        screen.blit(maze_layer(grid, start, end), (0, 0))
+        pygame.display.update()
 
-def draw_info_panel(algo_name, elapsed_time):
+        clock = pygame.time.Clock()
+        begin = time.perf_counter() - PROGRESS_DELAY
+        while not task.done:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    task.cancel()
+                    task.wait()
+                    pygame.quit()
+                    sys.exit()
+                if button_handler.is_click_event(event, cancel_button.rect):
+                    sound_click.play()
+                    task.cancel()
+                    task.wait()  # La recherche s'arrête avant que la partie suivante ne mesure les siennes
+                    return None
+
+            cancel_button.check_hover(pygame.mouse.get_pos())
+            cancel_button.draw()
+            panel_rect = draw_progress_panel(*task.progress(), time.perf_counter() - begin)
+            pygame.display.update([panel_rect, cancel_button.rect])
+            clock.tick(PROGRESS_FPS)
+
+    if task.error is not None:
+        raise task.error
+    return task.results
+
+def format_stats(stats):
+    """
+    Résume les compteurs d'une recherche sur une ligne.
+    """
+    if stats is None:
+        return ""
+    return (f"Développés : {stats.expanded} | Voisins : {stats.scanned} | File : +{stats.pushes} / -{stats.pops}"
+            f" | Périmés : {stats.stale} | Front max : {stats.max_frontier}")
+
+def draw_info_panel(algo_name, elapsed_time, stats=None):
     """
     Affiche un panneau d'informations en bas de l'écran.
     """
@@ -494,10 +532,12 @@ def draw_info_panel(algo_name, elapsed_time):
     pygame.draw.rect(screen, BLACK, panel_rect)
 
     # Afficher le texte
-    font = pygame.font.Font(None, 36)
     info_text = f"Algorithme : {algo_name} | Temps : {elapsed_time*(10**6):.2f} us"
-    text_surface = font.render(info_text, True, WHITE)
-    screen.blit(text_surface, (20, WINDOW_HEIGHT - 40))
+    text_surface = render_text(30, info_text, WHITE)
+    screen.blit(text_surface, (20, WINDOW_HEIGHT - 46))
+
+    stats_surface = render_text(22, format_stats(stats), WHITE)
+    screen.blit(stats_surface, (20, WINDOW_HEIGHT - 22))
 
 #--------------------------------------- Menu Principal et Sélection d'Algorithme -----------------------------------
 def main_menu():
@@ -511,69 +551,54 @@ def main_menu():
 
     start_button = Button((WINDOW_WIDTH - 200) // 2, (WINDOW_HEIGHT - 50) // 2, 200, 50, GREY, "START")
 
-    while True:
+    def draw_background():
         screen.blit(background_image, (0, 0))
 
         # Afficher le titre "Menu Principal"
-        font = pygame.font.Font(None, 72)
-        title_surface = font.render("Menu Principal", True, WHITE)
+        title_surface = render_text(72, "Menu Principal", WHITE)
         screen.blit(title_surface, ((WINDOW_WIDTH - title_surface.get_width()) // 2, 50))
 
-        # Vérifier le survol et dessiner le bouton
-        mouse_pos = pygame.mouse.get_pos()
-        start_button.check_hover(mouse_pos)
-        start_button.draw()
-        pygame.display.update()
-
-        # Gestion des événements
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            # Vérification du clic sur le bouton "Commencer" avec anti-rebonds
-            if button_handler.is_clicked(start_button.rect):
-                sound_Click_start.play()
-                return
+    # Attente du clic sur le bouton "Commencer" avec anti-rebonds
+    wait_for_click([start_button], draw_background)
+    sound_Click_start.play()
 
 def size_menu():
     """
-    Affiche un menu pour choisir la taille du labyrinthe (Petit, Moyen, Grand).
+    Affiche un menu pour choisir le générateur et la taille du labyrinthe (Petit, Moyen, Grand).
+    Renvoie (taille, clé du générateur).
     """
+    # Boutons des générateurs sur une ligne, le générateur choisi est mis en évidence
+    generator = 'backtracker'
+    step = min(170, (WINDOW_WIDTH - 30) // len(GENERATORS))
+    left = (WINDOW_WIDTH - len(GENERATORS) * step + 10) // 2
+    generator_buttons = [(key, Button(left + i * step, 170, step - 10, 50, GREY, name))
+                         for i, (key, (name, _)) in enumerate(GENERATORS.items())]
+
     S_button = Button((WINDOW_WIDTH - 200) // 2, (WINDOW_HEIGHT - 50) // 2, 200, 50, GREY, "Petit")
     M_button = Button((WINDOW_WIDTH - 200) // 2, (WINDOW_HEIGHT - 50) // 2 + 60, 200, 50, GREY, "Moyen")
     L_button = Button((WINDOW_WIDTH - 200) // 2, (WINDOW_HEIGHT - 50) // 2 + 120, 200, 50, GREY, "Grand")
 
-    while True:
+    sizes = {S_button: 20, M_button: 30, L_button: 40}
+    generators = {button: key for key, button in generator_buttons}
+
+    def draw_background():
         screen.blit(background_image, (0, 0))
 
-        font = pygame.font.Font(None, 50)
-        title_surface = font.render("Choix de la taille du labyrinthe", True, WHITE)
+        title_surface = render_text(50, "Choix de la taille du labyrinthe", WHITE)
         screen.blit(title_surface, ((WINDOW_WIDTH - title_surface.get_width()) // 2, 50))
+        label_surface = render_text(36, "Générateur", WHITE)
+        screen.blit(label_surface, ((WINDOW_WIDTH - label_surface.get_width()) // 2, 130))
 
-        # Vérifier le survol et dessiner les boutons
-        mouse_pos = pygame.mouse.get_pos()
-        for size_button in [S_button, M_button, L_button]:
-            size_button.check_hover(mouse_pos)
-            size_button.draw()
-
-        pygame.display.update()
-
-        # Gestion des événements
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    while True:
+        for key, generator_button in generator_buttons:
+            generator_button.color = SELECTED_COLOR if key == generator else GREY
 
-            if button_handler.is_clicked(S_button.rect):
-                sound_click.play()
-                return 20
-            elif button_handler.is_clicked(M_button.rect):
-                sound_click.play()
-                return 30
-            elif button_handler.is_clicked(L_button.rect):
-                sound_click.play()
-                return 40
+        # Un clic sur un générateur change la sélection et redessine le menu
+        clicked = wait_for_click(list(sizes) + list(generators), draw_background)
+        sound_click.play()
+        if clicked in sizes:
+            return sizes[clicked], generator
+        generator = generators[clicked]
 
 def algorithm_selection_menu():
     """
@@ -582,191 +607,179 @@ def algorithm_selection_menu():
     screen.blit(background_image, (0, 0))
 
     # Afficher le titre "Choisissez un mode"
-    font = pygame.font.Font(None, 60)
-    title_surface = font.render("Choisissez un mode", True, WHITE)
+    title_surface = render_text(60, "Choisissez un mode", WHITE)
     screen.blit(title_surface, ((WINDOW_WIDTH - title_surface.get_width()) // 2, 50))
 
-    # Boutons pour les algorithmes
-    dijkstra_button = Button((WINDOW_WIDTH - 200) // 2, 150, 200, 50, GREEN, 'Dijkstra')
-    astar_button = Button((WINDOW_WIDTH - 200) // 2, 220, 200, 50, RED, 'A*')
-    bfs_button = Button((WINDOW_WIDTH - 200) // 2, 290, 200, 50, BLUE, 'BFS')
-    dfs_button = Button((WINDOW_WIDTH - 200) // 2, 360, 200, 50, YELLOW, 'DFS')
-    compare_button = Button((WINDOW_WIDTH - 200) // 2, 430, 200, 50, ORANGE, 'Comparer')
-
-    buttons = [dijkstra_button, astar_button, bfs_button, dfs_button, compare_button]
-    for button in buttons:
-        button.draw()
-
-    pygame.display.update()
-
-    chosen_algo = None
-    while not chosen_algo:
-        mouse_pos = pygame.mouse.get_pos()
-        for button in buttons:
-            button.check_hover(mouse_pos)
-            button.draw()
-
-        pygame.display.update()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if button_handler.is_clicked(dijkstra_button.rect):
-                sound_click.play()
-                chosen_algo = 'dijkstra'
-            elif button_handler.is_clicked(astar_button.rect):
-                sound_click.play()
-                chosen_algo = 'astar'
-            elif button_handler.is_clicked(bfs_button.rect):
-                sound_click.play()
-                chosen_algo = 'bfs'
-            elif button_handler.is_clicked(dfs_button.rect):
-                sound_click.play()
-                chosen_algo = 'dfs'
-            elif button_handler.is_clicked(compare_button.rect):
-                sound_click.play()
-                chosen_algo = 'compare'
+    # Boutons pour les algorithmes, répartis en colonnes de 6
+    options = [(key, algo_name) for key, (algo_name, _) in ALGORITHMS.items()] + [('compare', 'Comparer'), ('compare_parallel', 'Comparer //')]
+    per_column = 6
+    columns = (len(options) + per_column - 1) // per_column
+    left = (WINDOW_WIDTH - columns * 200 - (columns - 1) * 20) // 2
+    buttons = []
+    for i, (key, label) in enumerate(options):
+        x = left + (i // per_column) * 220
+        y = 150 + (i % per_column) * 70
+        buttons.append((key, Button(x, y, 200, 50, GREY, label)))
 
-    return chosen_algo
+    keys = {button: key for key, button in buttons}
+    clicked = wait_for_click(list(keys))
+    sound_click.play()
+    return keys[clicked]
 
-def display_solution(grid, start, end, path, algo_name, elapsed_time):
+def display_solution(grid, start, end, path, algo_name, elapsed_time, stats=None, background=None):
     """
-    Affiche la solution trouvée par l'algorithme.
+    Affiche la solution trouvée par l'algorithme, tracée sur background s'il est fourni.
+    Renvoie True si le joueur veut rejouer, False s'il veut quitter.
     """
-    path_points = []
+    animate_paths(grid, start, end, [path], background)
 
-    for cell in path:
-
-        x = EXTRA_WIDTH + cell.col * CELL_SIZE + CELL_SIZE // 2
-        y = EXTRA_HEIGHT + cell.row * CELL_SIZE + CELL_SIZE // 2
-        path_points.append((x, y))
-
-        screen.blit(background_image, (0, 0))
-        pygame.draw.rect(screen, BLACK, (EXTRA_WIDTH, EXTRA_HEIGHT, WIDTH, HEIGHT))
-        for row in grid:
-            for c in row:
-                c.draw()
-                
-
-        draw_start_end(start, end)
-
-        if len(path_points) > 1:
-            pygame.draw.lines(screen, RED, False, path_points, 3)
-
-        pygame.draw.circle(screen, RED, (x, y), CELL_SIZE // 4)
-
-        pygame.display.update()
-        pygame.time.delay(50)
-        evntQ();
-
-    draw_info_panel(algo_name, elapsed_time)
+    draw_info_panel(algo_name, elapsed_time, stats)
 
     retry_button = Button((WINDOW_WIDTH - 200) // 2, WINDOW_HEIGHT - WINDOW_HEIGHT / 2, 200, 50, BLUE, 'Réessayer')
     quit_button = Button((WINDOW_WIDTH - 200) // 2, WINDOW_HEIGHT - WINDOW_HEIGHT / 2 + 60, 200, 50, RED, 'Quitter')
 
-    handle_retry_or_quit(retry_button, quit_button)
+    return handle_retry_or_quit(retry_button, quit_button)
 
 def handle_retry_or_quit(retry_button, quit_button):
     """
     Gère les boutons "Réessayer" et "Quitter".
+    Renvoie True pour "Réessayer", False pour "Quitter".
     """
-    while True:
-        mouse_pos = pygame.mouse.get_pos()
-        for button in [retry_button, quit_button]:
-            button.check_hover(mouse_pos)
-            button.draw()
-
-        pygame.display.update()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif button_handler.is_clicked(retry_button.rect):
-                main()
-                return
-            elif button_handler.is_clicked(quit_button.rect):
-                pygame.quit()
-                sys.exit()
+    return wait_for_click([retry_button, quit_button]) is retry_button
 
 def display_no_solution(algo_name):
     """
     Affiche un message si aucun chemin n'a été trouvé.
     """
-    font = pygame.font.Font(None, 48)
-    text_surface = font.render(f"Aucun chemin trouvé pour {algo_name}", True, RED)
+    text_surface = render_text(48, f"Aucun chemin trouvé pour {algo_name}", RED)
     screen.blit(text_surface, ((WINDOW_WIDTH - text_surface.get_width()) // 2, WINDOW_HEIGHT // 2))
     pygame.display.update()
     pygame.time.delay(3000)
-    main()
 
-#--------------------------------------- Fonction Principale -----------------------------------
-def main():
+#--------------------------------------- Machine à États du Jeu -----------------------------------
+class Round:
     """
-    Fonction principale qui gère la logique du jeu.
+    Données d'une partie. Une nouvelle instance remplace la précédente à
+    chaque retour au menu principal : le labyrinthe, l'état de recherche et
+    les chemins de la partie terminée ne sont plus référencés et sont libérés.
     """
-    global ROWS, COLS, CELL_SIZE, CELL_SIZE_HEIGHT, CELL_SIZE_WIDTH, StartSound2
+    __slots__ = ('generator', 'chosen_algo', 'grid', 'start', 'end', 'algo_name',
+                 'elapsed_time', 'found', 'path', 'stats', 'results')
+
+    def __init__(self):
+        self.generator = self.chosen_algo = None
+        self.grid = self.start = self.end = None
+        self.algo_name = self.elapsed_time = self.stats = None
+        self.found = False
+        self.path = self.results = None
 
+def menu_state(game):
+    """
+    Menu principal, puis lancement de la musique de fond à la première partie.
+    """
+    global StartSound2
     main_menu()
 
     if StartSound2:
         sound_start.stop()
         pygame.mixer.music.play(-1)
         StartSound2 = False
+    return 'size'
 
-    ROWS = COLS = size_menu()
+def size_state(game):
+    """
+    Choix de la taille et du générateur, qui fixent la taille des cellules.
+    """
+    global ROWS, COLS, CELL_SIZE, CELL_SIZE_HEIGHT, CELL_SIZE_WIDTH
+
+    size, game.generator = size_menu()
+    ROWS = COLS = size
     CELL_SIZE_WIDTH = WIDTH // COLS
     CELL_SIZE_HEIGHT = HEIGHT // ROWS
     CELL_SIZE = min(CELL_SIZE_WIDTH, CELL_SIZE_HEIGHT)
+    return 'algorithm'
 
-    chosen_algo = algorithm_selection_menu()
+def algorithm_state(game):
+    """
+    Choix de l'algorithme, puis génération du labyrinthe.
+    """
+    game.chosen_algo = algorithm_selection_menu()
 
     # Génération du labyrinthe
-    grid = [[Cell(row, col) for col in range(COLS)] for row in range(ROWS)]
-    generate_lab(grid)
-    start, end = grid[random.randint(0, ROWS - 1)][0], grid[random.randint(0, ROWS - 1)][COLS - 1]
-
-    if chosen_algo == 'compare':
-        grid = [[Cell(row, col) for col in range(COLS)] for row in range(ROWS)]
-        generate_lab(grid)
-        results = compare_algorithms_animation(grid, start, end)
-        display_comparison_animation(grid, start, end, results)
-        display_comparison_results(results)
-        pygame.time.delay(5000)
-        main()
-        return
+    grid = game.grid = generate_maze(ROWS, COLS, game.generator)
+    prepare_maze(grid)  # Prétraitements mis en cache, hors du temps mesuré des recherches
+    game.start, game.end = grid[random.randint(0, ROWS - 1)][0], grid[random.randint(0, ROWS - 1)][COLS - 1]
+    maze_layer(grid, game.start, game.end)  # Couche statique dessinée une fois, réutilisée par les animations
+    return 'solve'
+
+def solve_state(game):
+    """
+    Exécute l'algorithme choisi, ou tous les algorithmes en mode comparaison.
+    """
+    if game.chosen_algo in ('compare', 'compare_parallel'):
+        game.results = compare_algorithms_animation(game.grid, game.start, game.end,
+                                                    parallel=game.chosen_algo == 'compare_parallel')
+        return 'results' if game.results is not None else 'menu'
+
+    results = run_task(SolveTask(game.grid, game.start, game.end, [game.chosen_algo]),
+                       game.grid, game.start, game.end)
+    if results is None:
+        return 'menu'  # Résolution annulée
+    (key, game.elapsed_time, game.found, game.path, game.stats), = results
+    game.algo_name = ALGORITHMS[key][0]
+    return 'display'
+
+def display_state(game):
+    """
+    Affiche la solution, ou le message d'échec, puis revient au menu ou quitte.
+    """
+    if not game.found:
+        display_no_solution(game.algo_name)
+        return 'menu'
+    # Exploration animée, pour les algorithmes qui ont une version pas à pas
+    explored = None
+    if game.chosen_algo in STEPPERS:
+        steps = STEPPERS[game.chosen_algo](game.grid, game.start, game.end, SearchState(game.grid))
+        explored = animate_exploration(game.grid, game.start, game.end, steps)
+    retry = display_solution(game.grid, game.start, game.end, game.path,
+                             game.algo_name, game.elapsed_time, game.stats, explored)
+    return 'menu' if retry else 'quit'
+
+def results_state(game):
+    """
+    Anime les chemins de la comparaison et affiche le classement.
+    """
+    display_comparison_animation(game.grid, game.start, game.end, game.results)
+    display_comparison_results(game.results)
+    pygame.time.delay(5000)
+    return 'menu'
+
+# États du jeu : chaque fonction reçoit la partie en cours et renvoie l'état suivant
+STATES = {
+    'menu': menu_state,
+    'size': size_state,
+    'algorithm': algorithm_state,
+    'solve': solve_state,
+    'display': display_state,
+    'results': results_state,
+}
 
-    elif chosen_algo in ['dijkstra', 'astar', 'bfs', 'dfs']:
-        grid = [[Cell(row, col) for col in range(COLS)] for row in range(ROWS)]
-        generate_lab(grid)
-        grid_copy = copy_grid(grid)
-        reset_grid(grid_copy)
-
-        start_time = time.time()
-
-        if chosen_algo == 'dijkstra':
-            found = dijkstra(grid_copy, grid_copy[start.row][start.col], grid_copy[end.row][end.col])
-            algo_name = 'Dijkstra'
-        elif chosen_algo == 'astar':
-            found = a_star(grid_copy, grid_copy[start.row][start.col], grid_copy[end.row][end.col])
-            algo_name = 'A*'
-        elif chosen_algo == 'bfs':
-            found = bfs(grid_copy, grid_copy[start.row][start.col], grid_copy[end.row][end.col])
-            algo_name = 'BFS'
-        elif chosen_algo == 'dfs':
-            found = dfs(grid_copy, grid_copy[start.row][start.col], grid_copy[end.row][end.col])
-            algo_name = 'DFS'
-
-        elapsed_time = time.time() - start_time
-
-        if found:
-            path = reconstruct_p(grid_copy[end.row][end.col])
-            display_solution(grid, start, end, path, algo_name, elapsed_time)
-        else:
-            display_no_solution(algo_name)
-        pygame.display.update()
+#--------------------------------------- Fonction Principale -----------------------------------
+def main():
+    """
+    Fonction principale qui gère la logique du jeu : une seule boucle
+    parcourt les états de STATES jusqu'à l'état 'quit', sans récursion.
+    """
+    init_display()
+
+    state = 'menu'
+    game = None
+    while state != 'quit':
+        if state == 'menu':
+            game = Round()  # La partie précédente est libérée
+        state = STATES[state](game)
+
+    pygame.quit()
 
 #--------------------------------------- Lancement du Jeu -----------------------------------
 if __name__ == "__main__":
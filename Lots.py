@@ -0,0 +1,122 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Traitement par lots en ligne de commande : génère et résout de nombreux
+labyrinthes sur un groupe de processus, sans passer par les menus.
+
+Chaque labyrinthe est tiré à partir de sa propre graine (graine + rang) :
+sa taille, ses murs, son départ et son arrivée sont donc reproductibles
+indépendamment des autres et du nombre de processus. Une ligne JSON par
+(labyrinthe, algorithme) est écrite sur la sortie standard dès que le
+labyrinthe est résolu, dans l'ordre d'achèvement.
+
+Seul un nombre borné de labyrinthes est en cours à un instant donné : la
+mémoire ne dépend pas du nombre de labyrinthes demandés.
+
+Exemple :
+    python Lots.py --count 10000 --sizes 20 40 --generator kruskal --seed 1 --algorithms bfs astar > resultats.jsonl
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from Moteur import SearchState, reconstruct_p
+from Algorithmes import ALGORITHMS, GENERATORS, timed_search
+from Benchmark import seeded_maze
+
+#--------------------------------------- Résolution -----------------------------------
+def solve_maze(rank, seed, min_size, max_size, generator, algorithms):
+    """
+    Génère le labyrinthe de rang rank (graine seed + rank, côté tiré entre
+    min_size et max_size) et le résout avec chaque algorithme.
+    Renvoie un enregistrement par algorithme.
+    """
+    maze_seed = seed + rank
+    size = random.Random(maze_seed).randint(min_size, max_size)
+    grid, start, end = seeded_maze(size, size, maze_seed, generator)
+    state = SearchState(grid)
+
+    records = []
+    for key in algorithms:
+        elapsed_time, found, stats = timed_search(ALGORITHMS[key][1], grid, start, end, state)
+        record = {
+            'maze': rank, 'seed': maze_seed, 'generator': generator, 'rows': size, 'cols': size,
+            'start': [start.row, start.col], 'end': [end.row, end.col], 'algorithm': key, 'found': found,
+            'path_length': len(reconstruct_p(end, state)) if found else None,
+            'time_ns': round(elapsed_time * 1e9),
+        }
+        record.update(stats.as_dict())
+        records.append(record)
+    return records
+
+def write_records(records, output):
+    for record in records:
+        output.write(json.dumps(record))
+        output.write('\n')
+    output.flush()
+
+def run_batch(count, seed, min_size, max_size, generator, algorithms, workers=None, output=sys.stdout):
+    """
+    Résout count labyrinthes sur workers processus (0 : dans le processus
+    courant) en écrivant les enregistrements au fur et à mesure. Au plus deux
+    labyrinthes par processus sont en attente ou en cours à la fois.
+    """
+    task = (seed, min_size, max_size, generator, algorithms)
+    if workers == 0:
+        for rank in range(count):
+            write_records(solve_maze(rank, *task), output)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    ranks = iter(range(count))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        try:
+            while True:
+                for rank in ranks:
+                    pending.add(executor.submit(solve_maze, rank, *task))
+                    if len(pending) >= 2 * workers:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    write_records(future.result(), output)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+#--------------------------------------- Ligne de commande -----------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Génère et résout des labyrinthes par lots, "
+                                                 "une ligne JSON par (labyrinthe, algorithme).")
+    parser.add_argument('--count', type=int, default=100, help="nombre de labyrinthes")
+    parser.add_argument('--sizes', type=int, nargs=2, default=[20, 40], metavar=('MIN', 'MAX'),
+                        help="côtés minimal et maximal des labyrinthes (20 40 par défaut)")
+    parser.add_argument('--generator', choices=list(GENERATORS), default='backtracker',
+                        help="générateur des labyrinthes (backtracker par défaut)")
+    parser.add_argument('--seed', type=int, default=0, help="graine du premier labyrinthe")
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=list(ALGORITHMS),
+                        help="algorithmes à exécuter (tous par défaut)")
+    parser.add_argument('--workers', type=int,
+                        help="nombre de processus (un par cœur par défaut, 0 : sans processus annexe)")
+    args = parser.parse_args(argv)
+    if not 1 <= args.sizes[0] <= args.sizes[1]:
+        parser.error("--sizes attend MIN et MAX avec 1 <= MIN <= MAX")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        run_batch(args.count, args.seed, args.sizes[0], args.sizes[1], args.generator, args.algorithms, args.workers)
+    except BrokenPipeError:
+        # Sortie fermée par le lecteur (head, ...) : arrêt silencieux
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,952 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Moteur du labyrinthe : génération et algorithmes de recherche.
+
+Ce module ne dépend pas de Pygame et peut être importé sans affichage
+ni périphérique audio (traitements par lots, serveurs sans écran).
+"""
+import random
+import heapq
+from collections import deque
+from array import array
+from itertools import accumulate
+from math import sqrt
+
+#--------------------------------------- Constantes -----------------------------------
+# Bits des murs d'une cellule (un masque de 4 bits par cellule)
+TOP, RIGHT, BOTTOM, LEFT = 1, 2, 4, 8
+ALL_WALLS = TOP | RIGHT | BOTTOM | LEFT
+WALL_BITS = {'top': TOP, 'right': RIGHT, 'bottom': BOTTOM, 'left': LEFT}
+
+# Distance d'une cellule non atteinte (équivalent entier de float('inf'))
+INFINITY = 0x7FFFFFFF
+
+# Marques de visite des recherches bidirectionnelles
+FORWARD, BACKWARD = 1, 2
+
+# Directions des générateurs (haut, bas, gauche, droite) : mur à retirer ici, mur à retirer chez le voisin
+DIRECTION_WALLS = ((TOP, BOTTOM), (BOTTOM, TOP), (LEFT, RIGHT), (RIGHT, LEFT))
+
+#--------------------------------------- Classes -----------------------------------
+class Maze:
+    """
+    Topologie compacte du labyrinthe : les murs sont stockés sous forme de
+    masque de 4 bits par cellule dans un bytearray plat, indexé par
+    row * cols + col. Une fois généré, le labyrinthe est figé (freeze) et
+    partagé en lecture seule par toutes les recherches ; l'état propre à une
+    recherche vit dans un SearchState.
+
+    Les murs extérieurs ne sont jamais retirés, il n'est donc pas nécessaire
+    de tester les bords pour trouver les voisins accessibles.
+    """
+    __slots__ = ('rows', 'cols', 'walls', 'adjacency', '__weakref__')
+
+    def __init__(self, rows, cols, walls=None):
+        self.rows = rows
+        self.cols = cols
+        # Par défaut, toutes les cellules sont fermées
+        self.walls = bytearray([ALL_WALLS]) * (rows * cols) if walls is None else walls
+        self.adjacency = None  # Index CSR, construit par freeze()
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        # Permet l'accès historique grid[row][col]
+        if not 0 <= row < self.rows:
+            raise IndexError(row)
+        return _RowView(self, row)
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield _RowView(self, row)
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def cell(self, row, col):
+        return Cell(self, row * self.cols + col)
+
+    @property
+    def size(self):
+        return self.rows * self.cols
+
+    @property
+    def frozen(self):
+        # Murs immuables : bytes, ou vue en lecture seule d'un fichier (Stockage.PackedWalls)
+        return not isinstance(self.walls, bytearray)
+
+    def freeze(self):
+        """
+        Rend les murs immuables (toute modification ultérieure lève une
+        TypeError) et construit l'index d'adjacence partagé par les recherches.
+        """
+        if isinstance(self.walls, bytearray):
+            self.walls = bytes(self.walls)
+        self.adjacency = build_adjacency(self)
+
+
+class SearchState:
+    """
+    État de travail d'une recherche (visite, distance, précédent), stocké dans
+    des tableaux plats indexés comme les murs du labyrinthe. Un même état est
+    réutilisé d'une recherche à l'autre grâce à reset().
+    expanded compte les cellules développées par la dernière recherche ;
+    les compteurs détaillés ne sont relevés que si stats contient un SearchStats.
+    """
+    __slots__ = ('size', 'visited', 'distance', 'previous', 'expanded', 'stats')
+
+    def __init__(self, grid, stats=None):
+        self.size = grid.rows * grid.cols
+        self.visited = bytearray(self.size)
+        self.distance = array('i', [INFINITY]) * self.size
+        self.previous = array('i', [-1]) * self.size
+        self.expanded = 0
+        self.stats = stats
+
+    def reset(self):
+        """
+        Réinitialise l'état pour une nouvelle recherche.
+        """
+        self.visited[:] = bytearray(self.size)
+        self.distance[:] = array('i', [INFINITY]) * self.size
+        self.previous[:] = array('i', [-1]) * self.size
+        self.expanded = 0
+        if self.stats is not None:
+            self.stats.clear()
+
+
+class SearchStats:
+    """
+    Compteurs détaillés d'une recherche : cellules développées, voisins
+    examinés, insertions et retraits de la file (ou du tas), entrées
+    périmées ignorées et taille maximale du front.
+    """
+    __slots__ = ('expanded', 'scanned', 'pushes', 'pops', 'stale', 'max_frontier')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.expanded = 0
+        self.scanned = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale = 0
+        self.max_frontier = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"SearchStats({', '.join(f'{name}={value}' for name, value in self.as_dict().items())})"
+
+
+class _RowView:
+    """
+    Vue d'une ligne du labyrinthe, renvoyant des cellules à la demande.
+    """
+    __slots__ = ('grid', 'row')
+
+    def __init__(self, grid, row):
+        self.grid = grid
+        self.row = row
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.grid.cols:
+            raise IndexError(col)
+        return Cell(self.grid, self.row * self.grid.cols + col)
+
+    def __iter__(self):
+        base = self.row * self.grid.cols
+        for index in range(base, base + self.grid.cols):
+            yield Cell(self.grid, index)
+
+
+class Walls:
+    """
+    Vue des murs d'une cellule, utilisable comme l'ancien dictionnaire
+    {'top': bool, 'right': bool, 'bottom': bool, 'left': bool}.
+    """
+    __slots__ = ('grid', 'index')
+
+    def __init__(self, grid, index):
+        self.grid = grid
+        self.index = index
+
+    def __getitem__(self, name):
+        return bool(self.grid.walls[self.index] & WALL_BITS[name])
+
+    def __setitem__(self, name, value):
+        if value:
+            self.grid.walls[self.index] |= WALL_BITS[name]
+        else:
+            self.grid.walls[self.index] &= ~WALL_BITS[name]
+
+    def copy(self):
+        return {name: self[name] for name in WALL_BITS}
+
+
+class Cell:
+    """
+    Vue légère d'une cellule du labyrinthe : ne stocke que la grille et
+    l'indice, les murs sont lus dans le masque de la grille.
+    """
+    __slots__ = ('grid', 'index')
+
+    def __init__(self, grid, index):
+        self.grid = grid
+        self.index = index
+
+    @property
+    def row(self):
+        return self.index // self.grid.cols
+
+    @property
+    def col(self):
+        return self.index % self.grid.cols
+
+    @property
+    def walls(self):
+        return Walls(self.grid, self.index)
+
+    def __eq__(self, other):
+        return isinstance(other, Cell) and self.grid is other.grid and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.grid), self.index))
+
+    def __repr__(self):
+        return f"Cell({self.row}, {self.col})"
+
+def create_grid(rows, cols):
+    """
+    Crée une grille de cellules fermées de taille rows x cols.
+    """
+    return Maze(rows, cols)
+
+#--------------------------------------- Index d'adjacence -----------------------------------
+class Adjacency:
+    """
+    Index d'adjacence au format CSR : les voisins accessibles de la cellule i
+    sont neighbors[offsets[i]:offsets[i + 1]].
+    """
+    __slots__ = ('offsets', 'neighbors')
+
+    def __init__(self, offsets, neighbors):
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    def __getitem__(self, index):
+        return self.neighbors[self.offsets[index]:self.offsets[index + 1]]
+
+def wall_moves(cols):
+    """
+    Table indexée par un masque de murs donnant les décalages d'indice vers
+    les voisins accessibles (dans l'ordre haut, bas, gauche, droite).
+    """
+    moves = []
+    for mask in range(ALL_WALLS + 1):
+        deltas = []
+        if not mask & TOP:
+            deltas.append(-cols)
+        if not mask & BOTTOM:
+            deltas.append(cols)
+        if not mask & LEFT:
+            deltas.append(-1)
+        if not mask & RIGHT:
+            deltas.append(1)
+        moves.append(tuple(deltas))
+    return moves
+
+def wall_rows(grid):
+    """
+    Parcourt les murs du labyrinthe ligne par ligne (cols masques chacune),
+    sans décoder en entier un labyrinthe chargé d'un fichier.
+    """
+    iter_rows = getattr(grid.walls, 'iter_rows', None)
+    if iter_rows is not None:
+        return iter_rows()
+    walls, cols = grid.walls, grid.cols
+    return (walls[base:base + cols] for base in range(0, grid.rows * cols, cols))
+
+def build_adjacency(grid):
+    """
+    Construit l'index d'adjacence CSR d'un labyrinthe, ligne par ligne, dans
+    des tableaux alloués à leur taille finale : un premier passage sur les
+    murs fixe offsets, un second remplit neighbors. En dehors de l'index, la
+    mémoire de travail ne dépend que de la largeur du labyrinthe.
+    """
+    cols, size = grid.cols, grid.rows * grid.cols
+    moves = wall_moves(cols)
+    degrees = bytes(len(moves[mask]) if mask < len(moves) else 0 for mask in range(256))  # Table de bytes.translate
+
+    offsets = array('i', [0]) * (size + 1)
+    for base, line in zip(range(0, size, cols), wall_rows(grid)):
+        offsets[base:base + cols + 1] = array('i', accumulate(line.translate(degrees), initial=offsets[base]))
+
+    neighbors = array('i', [0]) * offsets[size]
+    for base, line in zip(range(0, size, cols), wall_rows(grid)):
+        neighbors[offsets[base]:offsets[base + cols]] = array('i', [index + delta
+                                                                    for index, mask in enumerate(line, base)
+                                                                    for delta in moves[mask]])
+    return Adjacency(offsets, neighbors)
+
+def get_adjacency(grid):
+    """
+    Renvoie l'index d'adjacence mis en cache avec le labyrinthe. Un
+    labyrinthe figé sans index (chargé d'un fichier par Stockage.load_maze)
+    le construit au premier appel et le garde ; un labyrinthe pas encore
+    figé reçoit un index temporaire.
+    """
+    if grid.adjacency is None:
+        if not grid.frozen:
+            return build_adjacency(grid)
+        grid.adjacency = build_adjacency(grid)
+    return grid.adjacency
+
+#--------------------------------------- Génération du Labyrinthe -----------------------------------
+def generate_lab(grid):
+    """
+    Génère un labyrinthe en utilisant un algorithme de backtracking avec une pile.
+    """
+    walls, cols = grid.walls, grid.cols
+    size = grid.rows * cols
+    visited = bytearray(size)
+    stack = []
+    current = 0
+    visited[current] = 1
+
+    while True:
+        # Voisins non visités : (indice, mur à retirer ici, mur à retirer là-bas)
+        candidates = []
+        col = current % cols
+        if current >= cols and not visited[current - cols]:
+            candidates.append((current - cols, TOP, BOTTOM))
+        if current + cols < size and not visited[current + cols]:
+            candidates.append((current + cols, BOTTOM, TOP))
+        if col > 0 and not visited[current - 1]:
+            candidates.append((current - 1, LEFT, RIGHT))
+        if col < cols - 1 and not visited[current + 1]:
+            candidates.append((current + 1, RIGHT, LEFT))
+
+        if candidates:
+            next_index, wall, opposite = random.choice(candidates)
+            stack.append(current)
+            walls[current] &= ~wall
+            walls[next_index] &= ~opposite
+            visited[next_index] = 1
+            current = next_index
+        elif stack:
+            current = stack.pop()
+        else:
+            break
+
+    grid.freeze()
+
+def border_directions():
+    """
+    Table indexée par la position d'une cellule sur les bords (bit 0 : première
+    ligne, 1 : dernière ligne, 2 : première colonne, 3 : dernière colonne)
+    donnant les directions qui restent à l'intérieur de la grille.
+    """
+    table = []
+    for border in range(16):
+        table.append(tuple(direction for direction, bit in enumerate((1, 2, 4, 8)) if not border & bit))
+    return table
+
+def generate_kruskal(grid):
+    """
+    Génère un labyrinthe avec l'algorithme de Kruskal randomisé : les murs
+    intérieurs sont parcourus dans un ordre aléatoire et retirés lorsqu'ils
+    séparent deux composantes (union-find sur des tableaux d'entiers).
+    """
+    walls, cols = grid.walls, grid.cols
+    size = grid.rows * cols
+
+    # Murs candidats codés 2 * i (mur droit de i) ou 2 * i + 1 (mur bas de i)
+    edges = [2 * index for index in range(size) if index % cols != cols - 1]
+    edges += range(1, 2 * (size - cols), 2)
+    random.shuffle(edges)
+
+    parent = array('i', range(size))
+    rank = bytearray(size)
+    remaining = size - 1
+    for edge in edges:
+        a = edge >> 1
+        b = a + cols if edge & 1 else a + 1
+
+        # Racines des deux cellules, avec compression de chemin par division de moitié
+        root_a = a
+        while parent[root_a] != root_a:
+            parent[root_a] = parent[parent[root_a]]
+            root_a = parent[root_a]
+        root_b = b
+        while parent[root_b] != root_b:
+            parent[root_b] = parent[parent[root_b]]
+            root_b = parent[root_b]
+        if root_a == root_b:
+            continue
+
+        # Union par rang
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+
+        if edge & 1:
+            walls[a] &= ~BOTTOM
+            walls[b] &= ~TOP
+        else:
+            walls[a] &= ~RIGHT
+            walls[b] &= ~LEFT
+        remaining -= 1
+        if not remaining:
+            break
+
+    grid.freeze()
+
+def generate_wilson(grid):
+    """
+    Génère un labyrinthe avec l'algorithme de Wilson : des marches aléatoires à
+    boucles effacées partent des cellules libres jusqu'à rejoindre le labyrinthe.
+    Le tirage est uniforme parmi tous les labyrinthes parfaits possibles.
+    """
+    walls, cols = grid.walls, grid.cols
+    size = grid.rows * cols
+    last_row = size - cols
+    deltas = (-cols, cols, -1, 1)
+    directions = border_directions()
+    choice = random.choice
+
+    in_maze = bytearray(size)
+    in_maze[random.randrange(size)] = 1
+    # Dernière direction de sortie de chaque cellule : la réécrire efface les boucles
+    exits = bytearray(size)
+
+    origins = list(range(size))
+    random.shuffle(origins)
+    for origin in origins:
+        if in_maze[origin]:
+            continue
+
+        # Marche aléatoire jusqu'au labyrinthe
+        current = origin
+        while not in_maze[current]:
+            col = current % cols
+            border = (current < cols) | (current >= last_row) << 1 | (col == 0) << 2 | (col == cols - 1) << 3
+            direction = choice(directions[border])
+            exits[current] = direction
+            current += deltas[direction]
+
+        # Ajout du chemin sans boucles
+        current = origin
+        while not in_maze[current]:
+            in_maze[current] = 1
+            direction = exits[current]
+            wall, opposite = DIRECTION_WALLS[direction]
+            walls[current] &= ~wall
+            current += deltas[direction]
+            walls[current] &= ~opposite
+
+    grid.freeze()
+
+def generate_prim(grid):
+    """
+    Génère un labyrinthe avec l'algorithme de Prim randomisé : à chaque étape,
+    un mur de la frontière du labyrinthe est tiré au hasard et retiré s'il mène
+    à une cellule encore libre.
+    """
+    walls, cols = grid.walls, grid.cols
+    size = grid.rows * cols
+    last_row = size - cols
+    deltas = (-cols, cols, -1, 1)
+    directions = border_directions()
+    rand = random.random
+
+    in_maze = bytearray(size)
+    # Murs de la frontière codés 4 * cellule + direction
+    frontier = []
+    current = random.randrange(size)
+    while True:
+        in_maze[current] = 1
+        col = current % cols
+        border = (current < cols) | (current >= last_row) << 1 | (col == 0) << 2 | (col == cols - 1) << 3
+        for direction in directions[border]:
+            if not in_maze[current + deltas[direction]]:
+                frontier.append(current << 2 | direction)
+
+        # Tirage d'un mur de la frontière menant à une cellule libre
+        while frontier:
+            position = int(rand() * len(frontier))
+            edge = frontier[position]
+            frontier[position] = frontier[-1]
+            frontier.pop()
+            index, direction = edge >> 2, edge & 3
+            current = index + deltas[direction]
+            if not in_maze[current]:
+                wall, opposite = DIRECTION_WALLS[direction]
+                walls[index] &= ~wall
+                walls[current] &= ~opposite
+                break
+        else:
+            break
+
+    grid.freeze()
+
+def remove_walls(current, next_cell):
+    """
+    Enlève les murs entre deux cellules adjacentes.
+    """
+    dx = current.col - next_cell.col
+    dy = current.row - next_cell.row
+
+    if dx == 1:
+        current.walls['left'] = False
+        next_cell.walls['right'] = False
+    elif dx == -1:
+        current.walls['right'] = False
+        next_cell.walls['left'] = False
+    elif dy == 1:
+        current.walls['top'] = False
+        next_cell.walls['bottom'] = False
+    elif dy == -1:
+        current.walls['bottom'] = False
+        next_cell.walls['top'] = False
+
+#--------------------------------------- Algorithmes de Recherche -----------------------------------
+def record_search(state, expanded, scanned=0, pushes=0, pops=0, stale=0, max_frontier=0):
+    """
+    Enregistre le bilan d'une recherche dans l'état (et ses compteurs détaillés s'ils sont activés).
+    """
+    state.expanded = expanded
+    stats = state.stats
+    if stats is not None:
+        stats.expanded = expanded
+        stats.scanned = scanned
+        stats.pushes = pushes
+        stats.pops = pops
+        stats.stale = stale
+        stats.max_frontier = max_frontier
+
+def run_steps(steps):
+    """
+    Épuise une recherche pas à pas et renvoie sa valeur de retour (trouvé ou non).
+    """
+    advance = steps.__next__
+    try:
+        while True:
+            advance()
+    except StopIteration as stop:
+        return stop.value
+
+# Chaque recherche est écrite une seule fois, sous forme de générateur (nom_steps)
+# qui produit l'indice de chaque cellule au moment où elle est développée et
+# renvoie True si la fin est atteinte ; le solveur du même nom l'épuise avec
+# run_steps. Le générateur ne garde que le front de la recherche.
+#
+# Les solveurs ne comptent dans la boucle que les retraits et les entrées
+# périmées ; les insertions s'en déduisent (retraits + taille finale de la
+# file), et les autres compteurs ne sont relevés que si state.stats est actif.
+
+def dijkstra_steps(grid, start, end, state):
+    """
+    Algorithme de Dijkstra pour trouver le chemin le plus court.
+    Version pas à pas : produit chaque cellule développée.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    distance, previous = state.distance, state.previous
+    counting = state.stats is not None
+    end_index = end.index
+    distance[start.index] = 0
+    queue = []
+    heapq.heappush(queue, (0, start.index))
+    found = False
+    pops = stale = scanned = max_frontier = 0
+
+    while queue:
+        if counting:
+            max_frontier = max(max_frontier, len(queue))
+        current_distance, current = heapq.heappop(queue)
+        pops += 1
+
+        if current_distance > distance[current]:
+            stale += 1  # Entrée périmée : la cellule a été réinsérée avec une meilleure distance
+            continue
+
+        yield current
+        if current == end_index:
+            found = True
+            break
+
+        if counting:
+            scanned += offsets[current + 1] - offsets[current]
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            temp_distance = current_distance + 1
+            if temp_distance < distance[neighbor]:
+                distance[neighbor] = temp_distance
+                previous[neighbor] = current
+                heapq.heappush(queue, (temp_distance, neighbor))
+
+    record_search(state, pops - stale, scanned, pops + len(queue), pops, stale, max_frontier)
+    return found
+
+def dijkstra(grid, start, end, state):
+    """
+    Algorithme de Dijkstra pour trouver le chemin le plus court.
+    """
+    return run_steps(dijkstra_steps(grid, start, end, state))
+
+def a_star_steps(grid, start, end, state):
+    """
+    Algorithme A* pour trouver le chemin le plus court.
+    Version pas à pas : produit chaque cellule développée.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    distance, previous, cols = state.distance, state.previous, grid.cols
+    counting = state.stats is not None
+    end_index, end_row, end_col = end.index, end.row, end.col
+    open_set = []
+    heapq.heappush(open_set, (0, 0, start.index))
+    distance[start.index] = 0
+    found = False
+    pops = stale = scanned = max_frontier = 0
+
+    while open_set:
+        if counting:
+            max_frontier = max(max_frontier, len(open_set))
+        _, g_score, current = heapq.heappop(open_set)
+        pops += 1
+
+        if g_score > distance[current]:
+            stale += 1  # Entrée périmée : la cellule a été réinsérée avec un meilleur coût
+            continue
+
+        yield current
+        if current == end_index:
+            found = True
+            break
+
+        if counting:
+            scanned += offsets[current + 1] - offsets[current]
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            tentative_g_score = g_score + 1
+            if tentative_g_score < distance[neighbor]:
+                distance[neighbor] = tentative_g_score
+                row, col = divmod(neighbor, cols)
+                f_cost = tentative_g_score + sqrt((row - end_row) ** 2 + (col - end_col) ** 2)
+                previous[neighbor] = current
+                heapq.heappush(open_set, (f_cost, tentative_g_score, neighbor))
+
+    record_search(state, pops - stale, scanned, pops + len(open_set), pops, stale, max_frontier)
+    return found
+
+def a_star(grid, start, end, state):
+    """
+    Algorithme A* pour trouver le chemin le plus court.
+    """
+    return run_steps(a_star_steps(grid, start, end, state))
+
+def bfs_steps(grid, start, end, state):
+    """
+    Algorithme BFS (Breadth-First Search) pour trouver le chemin le plus court.
+    Version pas à pas : produit chaque cellule développée.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    visited, distance, previous = state.visited, state.distance, state.previous
+    counting = state.stats is not None
+    end_index = end.index
+    queue = deque([start.index])
+    distance[start.index] = 0
+    visited[start.index] = 1
+    found = False
+    pops = scanned = max_frontier = 0
+
+    while queue:
+        if counting:
+            max_frontier = max(max_frontier, len(queue))
+        current = queue.popleft()
+        pops += 1
+
+        yield current
+        if current == end_index:
+            found = True
+            break
+
+        if counting:
+            scanned += offsets[current + 1] - offsets[current]
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                distance[neighbor] = distance[current] + 1
+                previous[neighbor] = current
+                queue.append(neighbor)
+
+    record_search(state, pops, scanned, pops + len(queue), pops, 0, max_frontier)
+    return found
+
+def bfs(grid, start, end, state):
+    """
+    Algorithme BFS (Breadth-First Search) pour trouver le chemin le plus court.
+    """
+    return run_steps(bfs_steps(grid, start, end, state))
+
+def dfs_steps(grid, start, end, state):
+    """
+    Algorithme DFS (Depth-First Search) pour explorer le labyrinthe.
+    Version pas à pas : produit chaque cellule développée.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    visited, previous = state.visited, state.previous
+    counting = state.stats is not None
+    end_index = end.index
+    stack = [start.index]
+    visited[start.index] = 1
+    found = False
+    pops = scanned = max_frontier = 0
+
+    while stack:
+        if counting:
+            max_frontier = max(max_frontier, len(stack))
+        current = stack.pop()
+        pops += 1
+
+        yield current
+        if current == end_index:
+            found = True
+            break
+
+        if counting:
+            scanned += offsets[current + 1] - offsets[current]
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                previous[neighbor] = current
+                stack.append(neighbor)
+
+    record_search(state, pops, scanned, pops + len(stack), pops, 0, max_frontier)
+    return found
+
+def dfs(grid, start, end, state):
+    """
+    Algorithme DFS (Depth-First Search) pour explorer le labyrinthe.
+    """
+    return run_steps(dfs_steps(grid, start, end, state))
+
+def bidirectional_bfs_steps(grid, start, end, state):
+    """
+    BFS bidirectionnel : développe alternativement, niveau par niveau, le plus
+    petit des deux fronts (depuis le départ et depuis la fin) et s'arrête dès
+    qu'ils se rencontrent. Le chemin est ensuite recousu dans state.previous
+    pour que reconstruct_p le parcoure comme celui d'un BFS classique.
+    Version pas à pas : produit chaque cellule développée.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    visited, distance, previous = state.visited, state.distance, state.previous
+    counting = state.stats is not None
+    start_index, end_index = start.index, end.index
+
+    visited[start_index] = FORWARD
+    distance[start_index] = 0
+    if start_index == end_index:
+        record_search(state, 0)
+        return True
+
+    # Le côté arrière ne touche que peu de cellules : dictionnaires creux
+    back_distance = {end_index: 0}
+    back_previous = {end_index: -1}
+    visited[end_index] = BACKWARD
+
+    forward, backward = [start_index], [end_index]
+    meeting = None
+    pops = scanned = max_frontier = 0
+    pushes = 2
+    while forward and backward and meeting is None:
+        if counting:
+            max_frontier = max(max_frontier, len(forward) + len(backward))
+        if len(forward) <= len(backward):
+            frontier, mark, own_distance, own_previous, other_distance = forward, FORWARD, distance, previous, back_distance
+        else:
+            frontier, mark, own_distance, own_previous, other_distance = backward, BACKWARD, back_distance, back_previous, distance
+
+        next_level = []
+        best = INFINITY
+        pops += len(frontier)
+        for current in frontier:
+            yield current
+            if counting:
+                scanned += offsets[current + 1] - offsets[current]
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                seen = visited[neighbor]
+                if seen == mark:
+                    continue
+                if seen:
+                    # Rencontre avec l'autre front : on garde la plus courte du niveau
+                    total = own_distance[current] + 1 + other_distance[neighbor]
+                    if total < best:
+                        best = total
+                        meeting = (current, neighbor) if mark == FORWARD else (neighbor, current)
+                    continue
+                visited[neighbor] = mark
+                own_distance[neighbor] = own_distance[current] + 1
+                own_previous[neighbor] = current
+                next_level.append(neighbor)
+
+        pushes += len(next_level)
+        if mark == FORWARD:
+            forward = next_level
+        else:
+            backward = next_level
+
+    record_search(state, pops, scanned, pushes, pops, 0, max_frontier)
+    if meeting is None:
+        return False
+
+    forward_side, backward_side = meeting
+    _join_paths(previous, back_previous, forward_side, backward_side)
+    return True
+
+def bidirectional_bfs(grid, start, end, state):
+    """
+    BFS bidirectionnel : développe alternativement, niveau par niveau, le plus
+    petit des deux fronts (depuis le départ et depuis la fin) et s'arrête dès
+    qu'ils se rencontrent. Le chemin est ensuite recousu dans state.previous
+    pour que reconstruct_p le parcoure comme celui d'un BFS classique.
+    """
+    return run_steps(bidirectional_bfs_steps(grid, start, end, state))
+
+def bidirectional_a_star_steps(grid, start, end, state):
+    """
+    A* bidirectionnel : une recherche depuis chaque extrémité, guidées par
+    des potentiels moyens (h_fin - h_départ) / 2 et son opposé, qui restent
+    cohérents des deux côtés. La recherche s'arrête quand la somme des
+    meilleures clés des deux tas atteint le meilleur chemin de rencontre.
+    Version pas à pas : produit chaque cellule développée.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    visited, distance, previous, cols = state.visited, state.distance, state.previous, grid.cols
+    counting = state.stats is not None
+    start_index, end_index = start.index, end.index
+    start_row, start_col = divmod(start_index, cols)
+    end_row, end_col = divmod(end_index, cols)
+
+    visited[start_index] = FORWARD
+    distance[start_index] = 0
+    if start_index == end_index:
+        record_search(state, 0)
+        return True
+
+    back_distance = {end_index: 0}
+    back_previous = {end_index: -1}
+    visited[end_index] |= BACKWARD
+
+    def potential(index):
+        row, col = divmod(index, cols)
+        return (sqrt((row - end_row) ** 2 + (col - end_col) ** 2)
+                - sqrt((row - start_row) ** 2 + (col - start_col) ** 2)) / 2
+
+    # Chaque côté : (tas, marque, marque de l'autre côté, distances, précédents, distances de l'autre côté, signe du potentiel)
+    forward_set = [(potential(start_index), 0, start_index)]
+    backward_set = [(-potential(end_index), 0, end_index)]
+    sides = (
+        (forward_set, FORWARD, BACKWARD, distance, previous, back_distance, 1),
+        (backward_set, BACKWARD, FORWARD, back_distance, back_previous, distance, -1),
+    )
+    best = INFINITY
+    meeting = None
+    turn = 0
+    pops = stale = scanned = max_frontier = 0
+
+    while forward_set and backward_set and forward_set[0][0] + backward_set[0][0] < best:
+        open_set, mark, other_mark, own_distance, own_previous, other_distance, sign = sides[turn]
+        turn ^= 1
+
+        if counting:
+            max_frontier = max(max_frontier, len(forward_set) + len(backward_set))
+        _, g_score, current = heapq.heappop(open_set)
+        pops += 1
+        if g_score > own_distance[current]:
+            stale += 1  # Entrée périmée : la cellule a été réinsérée avec un meilleur coût
+            continue
+
+        yield current
+        if counting:
+            scanned += offsets[current + 1] - offsets[current]
+        tentative_g_score = g_score + 1
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            seen = visited[neighbor]
+            if seen & mark and tentative_g_score >= own_distance[neighbor]:
+                continue
+            visited[neighbor] = seen | mark
+            own_distance[neighbor] = tentative_g_score
+            own_previous[neighbor] = current
+            heapq.heappush(open_set, (tentative_g_score + sign * potential(neighbor), tentative_g_score, neighbor))
+
+            if seen & other_mark and tentative_g_score + other_distance[neighbor] < best:
+                best = tentative_g_score + other_distance[neighbor]
+                meeting = neighbor
+
+    record_search(state, pops - stale, scanned, pops + len(forward_set) + len(backward_set), pops, stale, max_frontier)
+    if meeting is None:
+        return False
+
+    # La cellule de rencontre appartient aux deux côtés
+    _join_paths(previous, back_previous, previous[meeting], meeting)
+    return True
+
+def bidirectional_a_star(grid, start, end, state):
+    """
+    A* bidirectionnel : une recherche depuis chaque extrémité, guidées par
+    des potentiels moyens (h_fin - h_départ) / 2 et son opposé, qui restent
+    cohérents des deux côtés. La recherche s'arrête quand la somme des
+    meilleures clés des deux tas atteint le meilleur chemin de rencontre.
+    """
+    return run_steps(bidirectional_a_star_steps(grid, start, end, state))
+
+def _join_paths(previous, back_previous, forward_side, backward_side):
+    """
+    Recoud un chemin bidirectionnel dans le tableau des précédents : la
+    cellule backward_side est rattachée à forward_side, puis la chaîne du
+    côté arrière est retournée jusqu'à la fin.
+    """
+    previous[backward_side] = forward_side
+    current = backward_side
+    while back_previous[current] != -1:
+        following = back_previous[current]
+        previous[following] = current
+        current = following
+
+def get_neighbors(grid, cell):
+    """
+    Récupère les voisins accessibles d'une cellule.
+    """
+    return [Cell(grid, neighbor) for neighbor in get_adjacency(grid)[cell.index]]
+
+def heuristic(cell, end):
+    """
+    Heuristique pour l'algorithme A* (distance euclidienne).
+    """
+    return sqrt((cell.row - end.row) ** 2 + (cell.col - end.col) ** 2)
+
+def reconstruct_p(end, state):
+    """
+    Reconstruit le chemin trouvé à partir de la cellule de fin.
+    """
+    grid, previous = end.grid, state.previous
+    path = []
+    current = end.index
+    while previous[current] >= 0:
+        path.append(Cell(grid, current))
+        current = previous[current]
+    path.reverse()
+    return path
@@ -0,0 +1,155 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Comparaison des algorithmes répartie sur plusieurs processus.
+
+Le labyrinthe est transmis aux processus sous forme compacte (dimensions et
+masque de murs en bytes, quelques octets par cellule) : chaque processus le
+reconstruit et le prépare une seule fois, hors chronomètre, puis exécute les
+recherches qui lui sont confiées. Les chemins reviennent sous forme d'indices
+de cellules.
+
+Deux modes :
+- partagé : un groupe de processus se répartit les algorithmes, pour obtenir
+  tous les résultats au plus vite ;
+- isolé : chaque algorithme s'exécute seul dans un processus neuf, épinglé
+  sur un cœur, les algorithmes se succédant pour qu'aucune mesure ne subisse
+  la charge d'une autre.
+
+Exemple :
+    python Parallele.py --size 300 --seed 1 --isolated
+"""
+import argparse
+import multiprocessing
+import os
+
+from Moteur import Cell, SearchState, create_grid, reconstruct_p
+from Algorithmes import ALGORITHMS, generate_maze, prepare_maze, timed_search
+
+# Labyrinthe reconstruit dans chaque processus par _init_worker
+_worker_grid = None
+
+#--------------------------------------- Forme compacte -----------------------------------
+def maze_payload(grid):
+    """
+    Forme compacte et sérialisable d'un labyrinthe : (lignes, colonnes, murs).
+    """
+    return grid.rows, grid.cols, bytes(grid.walls)
+
+def maze_from_payload(payload):
+    """
+    Reconstruit un labyrinthe figé et préparé à partir de maze_payload.
+    """
+    rows, cols, walls = payload
+    grid = create_grid(rows, cols)
+    grid.walls = bytearray(walls)
+    grid.freeze()
+    prepare_maze(grid)
+    return grid
+
+#--------------------------------------- Processus de calcul -----------------------------------
+def _init_worker(payload, cpu=None):
+    """
+    Initialise un processus : épinglage éventuel sur un cœur, puis
+    reconstruction et préparation du labyrinthe, hors chronomètre.
+    """
+    global _worker_grid
+    if cpu is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {cpu})
+    _worker_grid = maze_from_payload(payload)
+
+def _solve(key, start_index, end_index):
+    """
+    Exécute une recherche chronométrée dans le processus courant.
+    Renvoie (clé, durée, trouvé, chemin en indices, compteurs).
+    """
+    grid = _worker_grid
+    start, end = Cell(grid, start_index), Cell(grid, end_index)
+    state = SearchState(grid)
+    elapsed_time, found, stats = timed_search(ALGORITHMS[key][1], grid, start, end, state)
+    path = [cell.index for cell in reconstruct_p(end, state)] if found else []
+    return key, elapsed_time, found, path, stats
+
+def available_cpus():
+    """
+    Cœurs utilisables par le processus courant.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def _collect(pending, cancelled=None, done=None, poll=0.05):
+    """
+    Attend les résultats pending et les renvoie dans leur ordre. Chaque
+    résultat est passé à done (facultatif) dès qu'il arrive, quel que soit son
+    rang. Renvoie None dès que cancelled est levé ; le groupe de processus est
+    alors arrêté par son bloc with.
+    """
+    results = [None] * len(pending)
+    waiting = list(range(len(pending)))
+    while waiting:
+        if cancelled is not None and cancelled.is_set():
+            return None
+        pending[waiting[0]].wait(poll)
+        still_waiting = []
+        for rank in waiting:
+            if pending[rank].ready():
+                results[rank] = pending[rank].get()
+                if done is not None:
+                    done(results[rank])
+            else:
+                still_waiting.append(rank)
+        waiting = still_waiting
+    return results
+
+def parallel_compare(grid, start, end, keys=None, isolated=False, workers=None, cancelled=None, done=None):
+    """
+    Exécute les algorithmes keys (tous par défaut) dans des processus séparés.
+
+    Renvoie une liste de (clé, durée, trouvé, chemin, compteurs), dans l'ordre
+    de keys, où chemin est la liste des indices de cellules de reconstruct_p.
+    cancelled (un threading.Event, facultatif) est surveillé pendant l'attente :
+    s'il est levé, les processus sont arrêtés (Pool.terminate) et la fonction
+    renvoie None. done (facultatif) reçoit chaque résultat dès qu'il arrive.
+    """
+    keys = list(ALGORITHMS) if keys is None else list(keys)
+    payload = maze_payload(grid)
+    # spawn : les processus ne recopient ni l'état de Pygame ni ses fils d'exécution
+    context = multiprocessing.get_context('spawn')
+
+    if not isolated:
+        # La sortie du bloc with termine les processus, même en cours de recherche
+        with context.Pool(workers, _init_worker, (payload,)) as pool:
+            pending = [pool.apply_async(_solve, (key, start.index, end.index)) for key in keys]
+            return _collect(pending, cancelled, done)
+
+    results = []
+    cpus = available_cpus()
+    for rank, key in enumerate(keys):
+        with context.Pool(1, _init_worker, (payload, cpus[rank % len(cpus)])) as pool:
+            result = _collect([pool.apply_async(_solve, (key, start.index, end.index))], cancelled, done)
+        if result is None:
+            return None
+        results.extend(result)
+    return results
+
+#--------------------------------------- Ligne de commande -----------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare les algorithmes de recherche sur plusieurs processus.")
+    parser.add_argument('--size', type=int, default=100, help="côté du labyrinthe")
+    parser.add_argument('--seed', type=int, default=0, help="graine du labyrinthe")
+    parser.add_argument('--workers', type=int, help="nombre de processus du mode partagé (un par cœur par défaut)")
+    parser.add_argument('--isolated', action='store_true', help="un processus épinglé par algorithme, l'un après l'autre")
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=list(ALGORITHMS),
+                        help="algorithmes à comparer (tous par défaut)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    grid = generate_maze(args.size, args.size, seed=args.seed)
+    start, end = grid[0][0], grid[args.size - 1][args.size - 1]
+    results = parallel_compare(grid, start, end, args.algorithms, args.isolated, args.workers)
+    for key, elapsed_time, found, path, stats in sorted(results, key=lambda result: result[1]):
+        print(f"{key:<12}{elapsed_time * 1e6:>14.1f} us{len(path) if found else '-':>9}{stats.expanded:>10}")
+
+if __name__ == "__main__":
+    main()
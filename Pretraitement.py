@@ -0,0 +1,424 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Prétraitement des labyrinthes : contraction des couloirs, élagage des
+impasses et oracle de distance pour les labyrinthes parfaits.
+
+Les labyrinthes générés sont surtout faits de longs couloirs (cellules de
+degré 2) et d'impasses. Chaque couloir est remplacé par une seule arête
+pondérée entre deux carrefours (cellules de degré différent de 2), et les
+recherches s'effectuent sur ce graphe réduit avant que le chemin ne soit
+redéployé cellule par cellule.
+"""
+import heapq
+import weakref
+from array import array
+from math import sqrt
+
+from Moteur import get_adjacency, record_search
+
+# Index mis en cache par labyrinthe (libérés avec lui)
+_contractions = weakref.WeakKeyDictionary()
+_oracles = weakref.WeakKeyDictionary()
+
+#--------------------------------------- Graphe contracté -----------------------------------
+class ContractedGraph:
+    """
+    Graphe des carrefours d'un labyrinthe.
+
+    - nodes[k] : cellule du carrefour k ; node_of[cellule] : k ou -1 ;
+    - couloir c : relie les carrefours corridor_ends[2c] et corridor_ends[2c + 1],
+      ses cellules intérieures sont corridor_cells[corridor_offsets[c]:corridor_offsets[c + 1]]
+      dans l'ordre du premier vers le second carrefour, et son poids vaut leur nombre + 1 ;
+    - corridor_of[cellule] / position[cellule] : couloir et rang d'une cellule intérieure ;
+    - les arêtes du carrefour k sont edge_targets[edge_offsets[k]:edge_offsets[k + 1]],
+      avec le couloir emprunté dans edge_corridors (les boucles sur un même carrefour sont omises).
+    """
+    __slots__ = ('cols', 'nodes', 'node_of', 'corridor_of', 'position',
+                 'corridor_ends', 'corridor_offsets', 'corridor_cells',
+                 'edge_offsets', 'edge_targets', 'edge_corridors')
+
+    def __init__(self, grid):
+        self.cols = grid.cols
+        self.nodes = array('i')
+        self.node_of = array('i', [-1]) * grid.size
+        self.corridor_of = array('i', [-1]) * grid.size
+        self.position = array('i', [0]) * grid.size
+        self.corridor_ends = array('i')
+        self.corridor_offsets = array('i', [0])
+        self.corridor_cells = array('i')
+
+    def weight(self, corridor):
+        return self.corridor_offsets[corridor + 1] - self.corridor_offsets[corridor] + 1
+
+    def corridor_from(self, corridor, node):
+        """
+        Cellules intérieures d'un couloir, dans l'ordre en partant du carrefour node.
+        """
+        cells = self.corridor_cells[self.corridor_offsets[corridor]:self.corridor_offsets[corridor + 1]].tolist()
+        if self.corridor_ends[2 * corridor] != node:
+            cells.reverse()
+        return cells
+
+def contract(grid):
+    """
+    Construit le graphe contracté d'un labyrinthe en un passage sur ses cellules.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    graph = ContractedGraph(grid)
+    nodes, node_of = graph.nodes, graph.node_of
+    corridor_of, position = graph.corridor_of, graph.position
+
+    for index in range(grid.size):
+        if offsets[index + 1] - offsets[index] != 2:
+            node_of[index] = len(nodes)
+            nodes.append(index)
+
+    def add_corridor(origin, arrival, cells):
+        corridor = len(graph.corridor_ends) // 2
+        graph.corridor_ends.append(node_of[origin])
+        graph.corridor_ends.append(node_of[arrival])
+        for rank, cell in enumerate(cells):
+            corridor_of[cell] = corridor
+            position[cell] = rank
+        graph.corridor_cells.extend(cells)
+        graph.corridor_offsets.append(len(graph.corridor_cells))
+
+    def walk_corridors(origin):
+        for first in neighbors[offsets[origin]:offsets[origin + 1]]:
+            if node_of[first] >= 0:
+                if origin < first:  # Deux carrefours voisins : couloir vide, compté une fois
+                    add_corridor(origin, first, [])
+                continue
+            if corridor_of[first] >= 0:
+                continue  # Couloir déjà parcouru depuis son autre extrémité
+            cells = []
+            previous, current = origin, first
+            while node_of[current] < 0:
+                cells.append(current)
+                left, right = neighbors[offsets[current]], neighbors[offsets[current] + 1]
+                previous, current = current, (right if left == previous else left)
+            add_corridor(origin, current, cells)
+
+    for node in range(len(nodes)):
+        walk_corridors(nodes[node])
+
+    # Les cycles sans aucun carrefour reçoivent un carrefour arbitraire
+    for index in range(grid.size):
+        if node_of[index] < 0 and corridor_of[index] == -1:
+            node_of[index] = len(nodes)
+            nodes.append(index)
+            walk_corridors(index)
+
+    # Arêtes au format CSR, sans les boucles d'un carrefour sur lui-même
+    ends = graph.corridor_ends
+    degrees = [0] * len(nodes)
+    for corridor in range(len(ends) // 2):
+        first, second = ends[2 * corridor], ends[2 * corridor + 1]
+        if first != second:
+            degrees[first] += 1
+            degrees[second] += 1
+    edge_offsets = array('i', [0]) * (len(nodes) + 1)
+    for node, degree in enumerate(degrees):
+        edge_offsets[node + 1] = edge_offsets[node] + degree
+    filled = edge_offsets[:-1]
+    edge_targets = array('i', [0]) * edge_offsets[-1]
+    edge_corridors = array('i', [0]) * edge_offsets[-1]
+    for corridor in range(len(ends) // 2):
+        first, second = ends[2 * corridor], ends[2 * corridor + 1]
+        if first == second:
+            continue
+        for node, target in ((first, second), (second, first)):
+            edge_targets[filled[node]] = target
+            edge_corridors[filled[node]] = corridor
+            filled[node] += 1
+    graph.edge_offsets, graph.edge_targets, graph.edge_corridors = edge_offsets, edge_targets, edge_corridors
+    return graph
+
+def get_contraction(grid):
+    """
+    Renvoie le graphe contracté mis en cache avec le labyrinthe, ou en
+    construit un temporaire si le labyrinthe n'est pas encore figé.
+    """
+    if not grid.frozen:
+        return contract(grid)
+    graph = _contractions.get(grid)
+    if graph is None:
+        graph = _contractions[grid] = contract(grid)
+    return graph
+
+#--------------------------------------- Recherche sur le graphe contracté -----------------------------------
+def _anchors(graph, cell):
+    """
+    Rattache une cellule au graphe : liste de (carrefour, distance, cellules
+    parcourues de la cellule jusqu'au carrefour inclus).
+    """
+    node = graph.node_of[cell]
+    if node >= 0:
+        return [(node, 0, [cell])]
+    corridor, rank = graph.corridor_of[cell], graph.position[cell]
+    first, second = graph.corridor_ends[2 * corridor], graph.corridor_ends[2 * corridor + 1]
+    cells = graph.corridor_from(corridor, first)
+    return [
+        (first, rank + 1, cells[rank::-1] + [graph.nodes[first]]),
+        (second, len(cells) - rank, cells[rank:] + [graph.nodes[second]]),
+    ]
+
+def prune_dead_ends(graph, kept):
+    """
+    Élague les impasses : retire itérativement les carrefours de degré 1 qui
+    ne font pas partie de kept. Renvoie un bytearray des carrefours retirés.
+    """
+    edge_offsets, edge_targets = graph.edge_offsets, graph.edge_targets
+    node_count = len(graph.nodes)
+    degree = [edge_offsets[node + 1] - edge_offsets[node] for node in range(node_count)]
+    removed = bytearray(node_count)
+    stack = [node for node in range(node_count) if degree[node] == 1 and node not in kept]
+
+    while stack:
+        node = stack.pop()
+        removed[node] = 1
+        for target in edge_targets[edge_offsets[node]:edge_offsets[node + 1]]:
+            if not removed[target]:
+                degree[target] -= 1
+                if degree[target] == 1 and target not in kept:
+                    stack.append(target)
+    return removed
+
+def contracted_path(graph, start_index, end_index, guided=False):
+    """
+    Plus court chemin entre deux cellules sur le graphe contracté élagué
+    (Dijkstra, ou A* si guided). Renvoie (liste des cellules du départ à la
+    fin, nombre de carrefours développés), ou (None, n) si la fin est inaccessible.
+    """
+    if start_index == end_index:
+        return [start_index], 0
+
+    sources = _anchors(graph, start_index)
+    targets = {}
+    for node, length, cells in _anchors(graph, end_index):
+        if node not in targets or length < targets[node][0]:
+            targets[node] = (length, cells)
+    removed = prune_dead_ends(graph, {node for node, _, _ in sources} | set(targets))
+
+    # Départ et fin dans le même couloir : chemin direct le long du couloir
+    best, best_node, direct = float('inf'), None, None
+    corridor = graph.corridor_of[start_index]
+    if corridor >= 0 and corridor == graph.corridor_of[end_index]:
+        cells = graph.corridor_cells[graph.corridor_offsets[corridor]:graph.corridor_offsets[corridor + 1]].tolist()
+        first, second = graph.position[start_index], graph.position[end_index]
+        direct = cells[first:second + 1] if first <= second else cells[first:second - 1 if second else None:-1]
+        best = len(direct) - 1
+
+    cols, nodes = graph.cols, graph.nodes
+    end_row, end_col = divmod(end_index, cols)
+
+    def estimate(node):
+        if not guided:
+            return 0
+        row, col = divmod(nodes[node], cols)
+        return sqrt((row - end_row) ** 2 + (col - end_col) ** 2)
+
+    distance, parent, origin = {}, {}, {}
+    open_set = []
+    for node, length, cells in sources:
+        if length < distance.get(node, float('inf')):
+            distance[node] = length
+            parent[node] = None
+            origin[node] = cells
+            heapq.heappush(open_set, (length + estimate(node), length, node))
+
+    edge_offsets, edge_targets, edge_corridors = graph.edge_offsets, graph.edge_targets, graph.edge_corridors
+    expanded = 0
+    while open_set:
+        key, length, node = heapq.heappop(open_set)
+        if key >= best:
+            break
+        if length > distance[node]:
+            continue
+        expanded += 1
+
+        if node in targets and length + targets[node][0] < best:
+            best, best_node = length + targets[node][0], node
+
+        for edge in range(edge_offsets[node], edge_offsets[node + 1]):
+            target = edge_targets[edge]
+            if removed[target]:
+                continue
+            tentative = length + graph.weight(edge_corridors[edge])
+            if tentative < distance.get(target, float('inf')):
+                distance[target] = tentative
+                parent[target] = (node, edge_corridors[edge])
+                heapq.heappush(open_set, (tentative + estimate(target), tentative, target))
+
+    if best_node is None:
+        return direct, expanded
+
+    # Redéploiement : fin -> carrefours -> départ, puis retournement
+    path = list(targets[best_node][1])  # Cellules de la fin jusqu'au carrefour d'arrivée
+    node = best_node
+    while parent[node] is not None:
+        previous_node, corridor = parent[node]
+        path.extend(reversed(graph.corridor_from(corridor, previous_node)))
+        path.append(nodes[previous_node])
+        node = previous_node
+    path.extend(reversed(origin[node][:-1]))
+    path.reverse()
+    return path, expanded
+
+def _contracted_search(grid, start, end, state, guided):
+    path, expanded = contracted_path(get_contraction(grid), start.index, end.index, guided)
+    record_search(state, expanded)
+    if path is None:
+        return False
+    previous, distance = state.previous, state.distance
+    distance[path[0]] = 0
+    for rank in range(1, len(path)):
+        previous[path[rank]] = path[rank - 1]
+        distance[path[rank]] = rank
+    return True
+
+def contracted_dijkstra(grid, start, end, state):
+    """
+    Dijkstra sur le graphe contracté et élagué, même interface que les
+    autres algorithmes de recherche.
+    """
+    return _contracted_search(grid, start, end, state, guided=False)
+
+def contracted_a_star(grid, start, end, state):
+    """
+    A* sur le graphe contracté et élagué (heuristique euclidienne entre
+    carrefours, cohérente car un couloir est au moins aussi long que la
+    distance entre ses extrémités).
+    """
+    return _contracted_search(grid, start, end, state, guided=True)
+
+#--------------------------------------- Oracle de distance (labyrinthes parfaits) -----------------------------------
+class TreeOracle:
+    """
+    Index des ancêtres d'un labyrinthe parfait (arbre couvrant), enraciné en
+    root. Chaque cellule garde son parent, sa profondeur et un pointeur de
+    saut (variante « skew-binary » du binary lifting, en mémoire O(n)) :
+    l'ancêtre commun de deux cellules se trouve en O(log n), sans recherche.
+    """
+    __slots__ = ('root', 'parent', 'depth', 'jump')
+
+    def __init__(self, root, parent, depth, jump):
+        self.root = root
+        self.parent = parent
+        self.depth = depth
+        self.jump = jump
+
+    def ancestor(self, cell, depth):
+        """
+        Ancêtre de cell situé à la profondeur donnée.
+        """
+        parent, jump, depths = self.parent, self.jump, self.depth
+        while depths[cell] > depth:
+            if depths[jump[cell]] < depth:
+                cell = parent[cell]
+            else:
+                cell = jump[cell]
+        return cell
+
+    def lca(self, first, second):
+        """
+        Plus proche ancêtre commun de deux cellules.
+        """
+        parent, jump, depth = self.parent, self.jump, self.depth
+        if depth[first] < depth[second]:
+            first, second = second, first
+        first = self.ancestor(first, depth[second])
+        while first != second:
+            if jump[first] == jump[second]:
+                first, second = parent[first], parent[second]
+            else:
+                first, second = jump[first], jump[second]
+        return first
+
+    def distance(self, first, second):
+        """
+        Longueur de l'unique chemin entre deux cellules.
+        """
+        return self.depth[first] + self.depth[second] - 2 * self.depth[self.lca(first, second)]
+
+    def path(self, first, second):
+        """
+        Cellules de l'unique chemin de first à second (extrémités comprises).
+        """
+        parent = self.parent
+        common = self.lca(first, second)
+        upward, downward = [], []
+        while first != common:
+            upward.append(first)
+            first = parent[first]
+        while second != common:
+            downward.append(second)
+            second = parent[second]
+        upward.append(common)
+        upward.extend(reversed(downward))
+        return upward
+
+def build_oracle(grid, root=0):
+    """
+    Construit l'oracle de distance d'un labyrinthe parfait par un parcours en
+    largeur depuis root. Lève une ValueError si le labyrinthe n'est pas un arbre.
+    """
+    adjacency = get_adjacency(grid)
+    offsets, neighbors = adjacency.offsets, adjacency.neighbors
+    size = grid.size
+    if len(neighbors) != 2 * (size - 1):
+        raise ValueError("L'oracle ne s'applique qu'aux labyrinthes parfaits (arbres couvrants)")
+
+    parent = array('i', [-1]) * size
+    depth = array('i', [0]) * size
+    jump = array('i', [0]) * size
+    jump[root] = root
+    order = [root]
+    reached = 1
+
+    for current in order:
+        # Les parents sont traités avant leurs enfants : leurs sauts sont déjà connus
+        current_jump = jump[current]
+        if depth[current] - depth[current_jump] == depth[current_jump] - depth[jump[current_jump]]:
+            child_jump = jump[current_jump]
+        else:
+            child_jump = current
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if neighbor == parent[current]:
+                continue
+            parent[neighbor] = current
+            depth[neighbor] = depth[current] + 1
+            jump[neighbor] = child_jump
+            order.append(neighbor)
+            reached += 1
+
+    if reached != size:
+        raise ValueError("L'oracle ne s'applique qu'aux labyrinthes parfaits (arbres couvrants)")
+    return TreeOracle(root, parent, depth, jump)
+
+def get_oracle(grid):
+    """
+    Renvoie l'oracle mis en cache avec le labyrinthe, ou en construit un
+    temporaire si le labyrinthe n'est pas encore figé.
+    """
+    if not grid.frozen:
+        return build_oracle(grid)
+    oracle = _oracles.get(grid)
+    if oracle is None:
+        oracle = _oracles[grid] = build_oracle(grid)
+    return oracle
+
+def oracle_search(grid, start, end, state):
+    """
+    Mode « oracle » : le chemin est lu dans l'index des ancêtres, sans
+    aucune recherche. Même interface que les autres algorithmes de recherche.
+    """
+    path = get_oracle(grid).path(start.index, end.index)
+    record_search(state, 0)
+    previous, distance = state.previous, state.distance
+    distance[path[0]] = 0
+    for rank in range(1, len(path)):
+        previous[path[rank]] = path[rank - 1]
+        distance[path[rank]] = rank
+    return True
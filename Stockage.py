@@ -0,0 +1,257 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Format binaire compact des labyrinthes et chargement par projection mémoire.
+
+Un fichier commence par un en-tête de HEADER.size octets (signature,
+version, dimensions, graine, générateur), suivi des murs à raison de
+2 bits par cellule : seuls les murs droit (bit 0) et bas (bit 1) sont
+stockés, les murs haut et gauche s'en déduisent (mur bas de la cellule
+du dessus, mur droit de la cellule de gauche, bords de la grille).
+Quatre cellules tiennent dans un octet, la cellule i occupant les bits
+2 * (i % 4) et 2 * (i % 4) + 1 de l'octet i // 4.
+
+load_maze projette le fichier en mémoire (mmap) sans le lire : les murs
+sont décodés à la demande, un labyrinthe de 10000 x 10000 s'ouvre donc
+immédiatement et plusieurs processus qui l'ouvrent partagent les mêmes
+pages du cache du système.
+
+Exemples :
+    python Stockage.py --size 10000 --seed 1 --output labyrinthe.laby
+    python Stockage.py --info labyrinthe.laby
+"""
+import argparse
+import mmap
+import struct
+import time
+
+from Moteur import TOP, RIGHT, BOTTOM, LEFT, Maze
+
+#--------------------------------------- Constantes -----------------------------------
+MAGIC = b'LABY'
+VERSION = 1
+
+# Signature, version, drapeaux, lignes, colonnes, graine, nom du générateur
+HEADER = struct.Struct('<4sHHIIq16s')
+HAS_SEED = 1
+
+# Codes 2 bits d'une cellule (mur droit : 1, mur bas : 2) et tables de conversion
+CODE_OF_MASK = bytes((mask & RIGHT and 1) | (mask & BOTTOM and 2) for mask in range(256))
+OWN_WALLS = bytes((code & 1 and RIGHT) | (code & 2 and BOTTOM) for code in range(256))
+LEFT_OF_CODE = bytes(code & 1 and LEFT for code in range(256))
+TOP_OF_CODE = bytes(code & 2 and TOP for code in range(256))
+SHIFTED = [bytes((value << shift) & 0xFF for value in range(256)) for shift in (0, 2, 4, 6)]
+EXTRACT = [bytes((value >> shift) & 3 for value in range(256)) for shift in (0, 2, 4, 6)]
+
+#--------------------------------------- En-tête -----------------------------------
+class MazeHeader:
+    """
+    Métadonnées d'un fichier de labyrinthe.
+    """
+    __slots__ = ('rows', 'cols', 'seed', 'generator')
+
+    def __init__(self, rows, cols, seed=None, generator=None):
+        self.rows = rows
+        self.cols = cols
+        self.seed = seed
+        self.generator = generator
+
+    def pack(self):
+        name = (self.generator or '').encode('ascii')
+        if len(name) > 16:
+            raise ValueError(f"nom de générateur trop long (16 caractères au plus) : {self.generator}")
+        flags = HAS_SEED if self.seed is not None else 0
+        return HEADER.pack(MAGIC, VERSION, flags, self.rows, self.cols, self.seed or 0, name)
+
+    @classmethod
+    def unpack(cls, data):
+        if len(data) < HEADER.size:
+            raise ValueError("fichier trop court pour contenir un en-tête de labyrinthe")
+        magic, version, flags, rows, cols, seed, name = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("signature absente : ce n'est pas un fichier de labyrinthe")
+        if version != VERSION:
+            raise ValueError(f"version de format non prise en charge : {version}")
+        return cls(rows, cols, seed if flags & HAS_SEED else None, name.rstrip(b'\0').decode('ascii') or None)
+
+    def __repr__(self):
+        return f"MazeHeader(rows={self.rows}, cols={self.cols}, seed={self.seed}, generator={self.generator!r})"
+
+def packed_size(rows, cols):
+    """
+    Taille en octets des murs compactés de rows x cols cellules.
+    """
+    return (rows * cols + 3) // 4
+
+#--------------------------------------- Écriture -----------------------------------
+def _pack_codes(codes):
+    """
+    Regroupe des codes 2 bits (un par octet, longueur multiple de 4) par quatre.
+    """
+    packed = 0
+    for shift in range(4):
+        packed |= int.from_bytes(codes[shift::4].translate(SHIFTED[shift]), 'little')
+    return packed.to_bytes(len(codes) // 4, 'little')
+
+def save_rows(rows, path, height, width, seed=None, generator=None):
+    """
+    Écrit un labyrinthe fourni ligne par ligne (objets bytes de masques de
+    murs, comme Flux.eller_rows) sans jamais le charger en entier.
+    """
+    header = MazeHeader(height, width, seed, generator)
+    pending = bytearray()
+    count = 0
+    with open(path, 'wb') as output:
+        output.write(header.pack())
+        for line in rows:
+            pending += line.translate(CODE_OF_MASK)
+            count += 1
+            usable = len(pending) & ~3
+            if usable >= 1 << 16:
+                output.write(_pack_codes(bytes(pending[:usable])))
+                del pending[:usable]
+        if count != height:
+            raise ValueError(f"{count} lignes reçues pour un labyrinthe de {height} lignes")
+        pending += bytes(-len(pending) % 4)
+        output.write(_pack_codes(bytes(pending)))
+
+def save_maze(grid, path, seed=None, generator=None):
+    """
+    Écrit un labyrinthe dans le format compact.
+    """
+    cols = grid.cols
+    walls = bytes(grid.walls)
+    save_rows((walls[row * cols:(row + 1) * cols] for row in range(grid.rows)),
+              path, grid.rows, cols, seed, generator)
+
+#--------------------------------------- Lecture -----------------------------------
+class PackedWalls:
+    """
+    Vue en lecture seule, sans copie, des murs compactés d'un labyrinthe :
+    se comporte comme Maze.walls (masque de 4 bits par cellule) pour la
+    lecture, en décodant les cellules à la demande.
+    """
+    __slots__ = ('rows', 'cols', 'packed', 'buffer')
+
+    def __init__(self, rows, cols, packed, buffer=None):
+        self.rows = rows
+        self.cols = cols
+        self.packed = packed    # memoryview des octets compactés
+        self.buffer = buffer    # projection mémoire gardée ouverte tant que la vue existe
+
+    def __len__(self):
+        return self.rows * self.cols
+
+    def _code(self, index):
+        return (self.packed[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(index)
+        size = self.rows * self.cols
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(index)
+        code = self._code(index)
+        mask = OWN_WALLS[code]
+        if index < self.cols or self._code(index - self.cols) & 2:
+            mask |= TOP
+        if index % self.cols == 0 or self._code(index - 1) & 1:
+            mask |= LEFT
+        return mask
+
+    def _row_codes(self, row):
+        # Codes 2 bits de la ligne, un par octet
+        first = row * self.cols
+        chunk = bytes(self.packed[first >> 2:(first + self.cols + 3) >> 2])
+        codes = bytearray(4 * len(chunk))
+        for shift in range(4):
+            codes[shift::4] = chunk.translate(EXTRACT[shift])
+        offset = first & 3
+        return bytes(codes[offset:offset + self.cols])
+
+    def _slice(self, index):
+        # Ne décode que les lignes qui contiennent les cellules demandées
+        cells = range(*index.indices(len(self)))
+        if not cells:
+            return b''
+        low, high = min(cells[0], cells[-1]), max(cells[0], cells[-1])
+        first_row, last_row = low // self.cols, high // self.cols
+        offset = first_row * self.cols
+        data = b''.join(self.iter_rows(first_row, last_row + 1))
+        if cells.step == 1:
+            return data[low - offset:high + 1 - offset]
+        return bytes(data[position - offset] for position in cells)
+
+    def iter_rows(self, first=0, stop=None):
+        """
+        Parcourt les lignes décodées first à stop - 1 (toutes par défaut), en
+        objets bytes de cols masques, comme Flux.eller_rows.
+        """
+        cols = self.cols
+        stop = self.rows if stop is None else stop
+        if first:
+            top = self._row_codes(first - 1).translate(TOP_OF_CODE)
+        else:
+            top = bytes([TOP]) * cols
+        for row in range(first, stop):
+            codes = self._row_codes(row)
+            left = bytes([LEFT]) + codes[:-1].translate(LEFT_OF_CODE)
+            mask = (int.from_bytes(codes.translate(OWN_WALLS), 'little')
+                    | int.from_bytes(left, 'little') | int.from_bytes(top, 'little'))
+            yield mask.to_bytes(cols, 'little')
+            top = codes.translate(TOP_OF_CODE)
+
+    def __iter__(self):
+        for line in self.iter_rows():
+            yield from line
+
+    def __bytes__(self):
+        return b''.join(self.iter_rows())
+
+def load_maze(path):
+    """
+    Ouvre un fichier de labyrinthe par projection mémoire, sans le lire.
+    Renvoie (labyrinthe, en-tête) ; les murs du labyrinthe sont une vue
+    PackedWalls sur le fichier. Le labyrinthe est figé mais son index
+    d'adjacence n'est pas construit : la première recherche le construit (en
+    lisant tout le fichier) et le garde pour les suivantes.
+    """
+    with open(path, 'rb') as source:
+        buffer = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    header = MazeHeader.unpack(buffer)
+    expected = HEADER.size + packed_size(header.rows, header.cols)
+    if len(buffer) != expected:
+        raise ValueError(f"taille de fichier incohérente : {len(buffer)} octets au lieu de {expected}")
+
+    walls = PackedWalls(header.rows, header.cols, memoryview(buffer)[HEADER.size:], buffer)
+    return Maze(header.rows, header.cols, walls), header
+
+#--------------------------------------- Ligne de commande -----------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Écrit ou décrit des labyrinthes au format binaire compact.")
+    parser.add_argument('--size', type=int, default=1000, help="côté du labyrinthe à générer (algorithme d'Eller)")
+    parser.add_argument('--seed', type=int, help="graine de la génération")
+    parser.add_argument('--output', help="fichier à écrire")
+    parser.add_argument('--info', help="fichier dont afficher l'en-tête")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    # Importé ici : Flux n'est utile qu'à la génération en ligne de commande
+    import random
+    from Flux import eller_rows
+
+    args = parse_args(argv)
+    if args.output:
+        if args.seed is not None:
+            random.seed(args.seed)
+        begin = time.perf_counter()
+        save_rows(eller_rows(args.size, args.size), args.output, args.size, args.size, args.seed, 'eller')
+        print(f"{args.output} : {args.size} x {args.size} écrit en {time.perf_counter() - begin:.2f} s")
+    if args.info:
+        begin = time.perf_counter()
+        grid, header = load_maze(args.info)
+        print(f"{header} ouvert en {(time.perf_counter() - begin) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
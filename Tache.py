@@ -0,0 +1,174 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Résolution en arrière-plan : les recherches s'exécutent dans un fil
+d'exécution séparé (ou dans des processus, via parallel_compare), pour que
+l'interface continue de se redessiner et de traiter les événements pendant
+qu'un grand labyrinthe est résolu.
+
+L'interface démarre la tâche, lit progress() à chaque image, peut l'annuler
+avec cancel(), et récupère results une fois done vrai. Ne dépend pas de
+Pygame.
+"""
+import threading
+import time
+from itertools import repeat
+
+from Moteur import SearchState, SearchStats, reconstruct_p
+from Algorithmes import ALGORITHMS, STEPPERS, timed_search
+from Parallele import parallel_compare
+
+# Nombre de cellules développées entre deux publications de l'avancement (et vérifications d'annulation)
+CHECK_STEPS = 1024
+
+#--------------------------------------- Tâche de résolution -----------------------------------
+class SolveTask:
+    """
+    Exécute les algorithmes keys sur un labyrinthe, en arrière-plan.
+
+    results est une liste de (clé, durée, trouvé, chemin, compteurs), dans
+    l'ordre de keys, où chemin est la liste des cellules de reconstruct_p
+    (vide si la fin n'est pas atteinte).
+
+    Les algorithmes qui ont une version pas à pas (STEPPERS) sont conduits
+    cellule par cellule : toutes les CHECK_STEPS cellules, le nombre de
+    cellules développées est publié et l'annulation vérifiée. Les autres, qui
+    ne développent pas les cellules une à une, ne sont annulés qu'entre deux
+    recherches. En mode parallèle, l'avancement est publié à la fin de chaque
+    recherche et l'annulation arrête les processus.
+    """
+    def __init__(self, grid, start, end, keys, parallel=False):
+        self.grid = grid
+        self.start_cell = start
+        self.end_cell = end
+        self.keys = list(keys)
+        self.parallel = parallel
+        self.results = None
+        self.error = None       # exception levée dans le fil, relevée par l'interface
+        self.completed = 0      # recherches terminées
+        self.expanded = 0       # cellules développées par les recherches terminées
+        self.current = 0        # cellules développées par la recherche en cours
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Attend la fin du fil d'exécution au plus timeout secondes ; renvoie True s'il est fini.
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def cancel(self):
+        """
+        Demande l'arrêt de la tâche ; wait() attend ensuite qu'il soit effectif.
+        """
+        self._cancelled.set()
+
+    def progress(self):
+        """
+        Renvoie (recherches terminées, recherches prévues, cellules développées jusqu'ici).
+        """
+        return self.completed, len(self.keys), self.expanded + self.current
+
+    def _run(self):
+        try:
+            if self.parallel:
+                results = self._run_parallel()
+            else:
+                results = self._run_serial()
+            if not self.cancelled:
+                self.results = results
+        except Exception as error:
+            self.error = error
+        finally:
+            self._done.set()
+
+    def _drive(self, steps, publish):
+        """
+        Épuise une recherche pas à pas par paquets de CHECK_STEPS cellules, en
+        vérifiant l'annulation entre deux paquets (et, avec publish, en publiant
+        l'avancement). Renvoie la valeur de retour de la recherche, ou None si
+        la tâche a été annulée.
+        """
+        advance, cancelled = steps.__next__, self._cancelled.is_set
+        try:
+            while True:
+                for _ in repeat(None, CHECK_STEPS):
+                    advance()
+                if publish:
+                    self.current += CHECK_STEPS
+                if cancelled():
+                    steps.close()
+                    return None
+        except StopIteration as stop:
+            return stop.value
+
+    def _timed_steps(self, stepper, state):
+        """
+        Mesure une recherche pas à pas comme timed_search : chronométrée sans
+        compteurs, puis relancée hors chronomètre avec les compteurs détaillés.
+        Renvoie (durée, trouvé, compteurs), ou None si la tâche a été annulée.
+        """
+        grid, start, end = self.grid, self.start_cell, self.end_cell
+        state.stats = None
+        state.reset()
+        start_time = time.perf_counter()
+        found = self._drive(stepper(grid, start, end, state), True)
+        elapsed_time = time.perf_counter() - start_time
+        if found is None:
+            return None
+
+        stats = state.stats = SearchStats()
+        state.reset()
+        if self._drive(stepper(grid, start, end, state), False) is None:
+            return None
+        state.stats = None
+        return elapsed_time, found, stats
+
+    def _run_serial(self):
+        grid, end = self.grid, self.end_cell
+        state = SearchState(grid)  # Un seul état de travail, réinitialisé pour chaque algorithme
+        results = []
+        for key in self.keys:
+            if self.cancelled:
+                return None
+            if key in STEPPERS:
+                measure = self._timed_steps(STEPPERS[key], state)
+                if measure is None:
+                    return None
+                elapsed_time, found, stats = measure
+            else:
+                elapsed_time, found, stats = timed_search(ALGORITHMS[key][1], grid, self.start_cell, end, state)
+            results.append((key, elapsed_time, found, reconstruct_p(end, state) if found else [], stats))
+            self.expanded += stats.expanded
+            self.current = 0
+            self.completed += 1
+        return results
+
+    def _search_done(self, result):
+        """
+        Publie une recherche terminée dans un processus (appelé par parallel_compare).
+        """
+        self.expanded += result[4].expanded
+        self.completed += 1
+
+    def _run_parallel(self):
+        grid = self.grid
+        compared = parallel_compare(grid, self.start_cell, self.end_cell, self.keys,
+                                    cancelled=self._cancelled, done=self._search_done)
+        if compared is None:
+            return None
+        return [(key, elapsed_time, found, [grid.cell(*divmod(index, grid.cols)) for index in path], stats)
+                for key, elapsed_time, found, path, stats in compared]
@@ -0,0 +1,248 @@
+#--------------------------------------- Importations -----------------------------------
+"""
+Algorithmes vectorisés avec NumPy, pour les grands labyrinthes.
+
+Ce module est optionnel : le moteur (Moteur.py) et l'interface fonctionnent
+sans NumPy, seuls les modes vectorisés sont alors indisponibles.
+"""
+import numpy as np
+
+from Moteur import TOP, RIGHT, BOTTOM, LEFT, ALL_WALLS, INFINITY, create_grid, record_search
+from Stockage import PackedWalls
+
+# Nombre maximal de cellules traitées à la fois par la génération par lots
+BATCH_CHUNK_CELLS = 1 << 22
+
+#--------------------------------------- Outils -----------------------------------
+def wall_array(grid):
+    """
+    Vue NumPy (uint8, sans copie) du masque de murs du labyrinthe ; les murs
+    compactés d'un fichier (Stockage.PackedWalls) sont décodés d'un bloc.
+    """
+    if isinstance(grid.walls, PackedWalls):
+        return unpack_walls(grid.walls.packed, grid.rows, grid.cols)
+    return np.frombuffer(grid.walls, dtype=np.uint8)
+
+def unpack_walls(packed, rows, cols):
+    """
+    Décode des murs compactés à 2 bits par cellule (format de Stockage.py)
+    en masques de 4 bits, sous forme de tableau uint8 plat.
+    """
+    data = np.frombuffer(packed, dtype=np.uint8)
+    codes = np.empty((data.size, 4), dtype=np.uint8)
+    for position in range(4):
+        codes[:, position] = (data >> (2 * position)) & 3
+    codes = codes.ravel()[:rows * cols].reshape(rows, cols)
+
+    right, bottom = codes & 1, codes >> 1
+    walls = right * np.uint8(RIGHT) | bottom * np.uint8(BOTTOM)
+    walls[0, :] |= TOP
+    walls[1:, :] |= bottom[:-1, :] * np.uint8(TOP)
+    walls[:, 0] |= LEFT
+    walls[:, 1:] |= right[:, :-1] * np.uint8(LEFT)
+    return walls.ravel()
+
+def direction_offsets(grid):
+    """
+    Table indexée par un bit de mur donnant le décalage d'indice vers la cellule voisine.
+    """
+    offsets = np.zeros(16, dtype=np.intp)
+    offsets[TOP] = -grid.cols
+    offsets[BOTTOM] = grid.cols
+    offsets[LEFT] = -1
+    offsets[RIGHT] = 1
+    return offsets
+
+#--------------------------------------- BFS par front d'onde -----------------------------------
+def wavefront_distances(grid, start, end=None):
+    """
+    BFS par front d'onde : tout le front est développé en une seule fois à
+    l'aide de masques booléens sur le champ de bits des murs.
+
+    Renvoie deux tableaux de la taille du labyrinthe :
+    - distance (int32), INFINITY pour les cellules non atteintes ;
+    - parent_dir (uint8), le bit du mur franchi pour rejoindre la cellule
+      parente (0 pour le départ et les cellules non atteintes).
+    Si end est donné, le parcours s'arrête dès que la fin est atteinte.
+    """
+    walls = wall_array(grid)
+    size, cols = grid.size, grid.cols
+    distance = np.full(size, INFINITY, dtype=np.int32)
+    parent_dir = np.zeros(size, dtype=np.uint8)
+    owner = np.empty(size, dtype=np.intp)  # Sert à dédoublonner le nouveau front
+
+    # (mur à franchir, décalage vers le voisin, direction du parent vue du voisin)
+    moves = ((TOP, -cols, BOTTOM), (BOTTOM, cols, TOP), (LEFT, -1, RIGHT), (RIGHT, 1, LEFT))
+
+    frontier = np.array([start.index], dtype=np.intp)
+    distance[start.index] = 0
+    step = 0
+
+    while frontier.size:
+        step += 1
+        frontier_walls = walls[frontier]
+
+        reached, directions = [], []
+        for wall, offset, back in moves:
+            neighbors = frontier[(frontier_walls & wall) == 0] + offset
+            reached.append(neighbors)
+            directions.append(np.full(neighbors.size, back, dtype=np.uint8))
+
+        reached = np.concatenate(reached)
+        directions = np.concatenate(directions)
+        fresh = distance[reached] == INFINITY
+        reached, directions = reached[fresh], directions[fresh]
+
+        # Une cellule atteinte par deux parents du même front n'est gardée qu'une fois
+        order = np.arange(reached.size)
+        owner[reached] = order
+        unique = owner[reached] == order
+        reached, directions = reached[unique], directions[unique]
+
+        distance[reached] = step
+        parent_dir[reached] = directions
+
+        if end is not None and distance[end.index] != INFINITY:
+            break
+        frontier = reached
+
+    return distance, parent_dir
+
+def directions_to_previous(grid, parent_dir):
+    """
+    Convertit un tableau de directions parentes en tableau d'indices
+    précédents (-1 si pas de parent), tel que le parcourt reconstruct_p.
+    """
+    previous = np.arange(grid.size, dtype=np.int32) + direction_offsets(grid)[parent_dir].astype(np.int32)
+    previous[parent_dir == 0] = -1
+    return previous
+
+def wavefront_bfs(grid, start, end, state):
+    """
+    BFS vectorisé, même interface que les autres algorithmes de recherche :
+    remplit l'état de recherche et renvoie True si la fin est atteinte.
+    """
+    distance, parent_dir = wavefront_distances(grid, start, end)
+
+    np.frombuffer(state.distance, dtype=np.int32)[:] = distance
+    np.frombuffer(state.previous, dtype=np.int32)[:] = directions_to_previous(grid, parent_dir)
+    reached = distance != INFINITY
+    np.frombuffer(state.visited, dtype=np.uint8)[:] = reached
+
+    # Chaque cellule atteinte est développée une fois, au sein de son front
+    record_search(state, int(np.count_nonzero(reached)))
+    return bool(distance[end.index] != INFINITY)
+
+#--------------------------------------- Génération par lots -----------------------------------
+def _splitmix64(values):
+    """
+    Fonction de mélange de SplitMix64 appliquée élément par élément (uint64,
+    arithmétique modulo 2 ** 64).
+    """
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+def maze_random_bits(seed, first, count, cells):
+    """
+    16 bits pseudo-aléatoires (uint16) par cellule pour les labyrinthes first
+    à first + count - 1 d'une série : le labyrinthe i ne dépend que de
+    (seed, i), il est donc identique quelle que soit la taille du lot qui le
+    contient. Chaque labyrinthe suit le flux SplitMix64 de sa propre clé.
+    """
+    words = (cells + 3) // 4
+    base = _splitmix64(np.array([seed], dtype=np.uint64))
+    keys = _splitmix64(base + np.arange(first, first + count, dtype=np.uint64))
+    steps = np.arange(1, words + 1, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    stream = _splitmix64(keys[:, None] + steps[None, :])
+    return stream.view(np.uint16)[:, :cells]
+
+def _binary_tree(bits):
+    """
+    Arbre binaire : chaque cellule s'ouvre vers le haut ou vers la gauche
+    (toujours à gauche sur la première ligne, en haut sur la première colonne).
+    """
+    north = (bits & 1).astype(bool)
+    north[:, 0, :] = False
+    north[:, 1:, 0] = True
+    west = ~north
+    west[:, :, 0] = False
+    return north, west
+
+def _sidewinder(bits):
+    """
+    Sidewinder : chaque ligne est découpée en segments ouverts vers la droite,
+    et chaque segment s'ouvre vers le haut par une de ses cellules tirée au
+    hasard (la première ligne forme un seul segment).
+    """
+    cols = bits.shape[2]
+    east = (bits & 1).astype(bool)
+    east[:, :, -1] = False
+    east[:, 0, :-1] = True
+
+    # Début du segment de chaque cellule : la colonne qui suit la dernière fermeture
+    marker = np.zeros(bits.shape, dtype=np.int32)
+    marker[:, :, 1:] = np.where(east[:, :, :-1], 0, np.arange(1, cols, dtype=np.int32))
+    start = np.maximum.accumulate(marker, axis=2)
+
+    # Pour chaque segment fermé (hors première ligne), une cellule tirée au hasard s'ouvre vers le haut
+    closed = ~east
+    closed[:, 0, :] = False
+    ends = np.flatnonzero(closed)
+    col = ends % cols
+    first = start.ravel()[ends]
+    fraction = (bits.ravel()[ends] >> 1) * (1.0 / 2 ** 15)
+    chosen = ends - col + first + (fraction * (col - first + 1)).astype(np.intp)
+    north = np.zeros(bits.shape, dtype=bool)
+    north.ravel()[chosen] = True
+
+    west = np.zeros(bits.shape, dtype=bool)
+    west[:, :, 1:] = east[:, :, :-1]
+    return north, west
+
+# Générateurs par lots : clé -> (nom affiché, fonction des passages ouverts)
+BATCH_GENERATORS = {
+    'binary_tree': ('Arbre binaire', _binary_tree),
+    'sidewinder': ('Sidewinder', _sidewinder),
+}
+
+def batch_generate(count, rows, cols, seed=0, method='sidewinder', first=0):
+    """
+    Génère count labyrinthes parfaits rows x cols d'un coup et renvoie leurs
+    masques de murs dans un tableau uint8 de forme (count, rows, cols), au même
+    codage que Maze.walls.
+
+    Chaque labyrinthe est tiré indépendamment à partir de (seed, first + k) :
+    batch_generate(1, ..., first=k) redonne exactement le labyrinthe k du lot.
+    Les lots sont traités par paquets de BATCH_CHUNK_CELLS cellules au plus.
+    """
+    carve = BATCH_GENERATORS[method][1]
+    walls = np.empty((count, rows, cols), dtype=np.uint8)
+    cells = rows * cols
+    chunk = max(1, BATCH_CHUNK_CELLS // cells)
+
+    for begin in range(0, count, chunk):
+        size = min(chunk, count - begin)
+        bits = maze_random_bits(seed, first + begin, size, cells).reshape(size, rows, cols)
+        north, west = carve(bits)
+
+        # Chaque mur est retiré au plus une fois : les ouvertures se soustraient du masque plein
+        block = np.full((size, rows, cols), ALL_WALLS, dtype=np.uint8)
+        block -= north * np.uint8(TOP)
+        block[:, :-1, :] -= north[:, 1:, :] * np.uint8(BOTTOM)
+        block -= west * np.uint8(LEFT)
+        block[:, :, :-1] -= west[:, :, 1:] * np.uint8(RIGHT)
+        walls[begin:begin + size] = block
+
+    return walls
+
+def batch_maze(batch, k):
+    """
+    Labyrinthe figé (Maze) construit à partir du k-ième masque d'un lot.
+    """
+    _, rows, cols = batch.shape
+    grid = create_grid(rows, cols)
+    grid.walls = bytearray(batch[k].tobytes())
+    grid.freeze()
+    return grid